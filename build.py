@@ -1,4 +1,5 @@
 import PyInstaller.__main__
+import argparse
 import os
 import platform
 import shutil
@@ -7,11 +8,14 @@ import shutil
 APP_NAME = "UltimateSnakeGame"
 ENTRY_POINT = "src/main.py"
 
-def build_executable():
-    # Prepare build command
+def build_executable(onefile=False):
+    # Prepare build command.
+    # Default is a one-folder build: --onefile unpacks the whole bundle to a temp dir on
+    # every launch, which adds seconds to cold start. Use --onefile only for distribution
+    # where a single file matters more than startup time.
     cmd = [
         "--name", APP_NAME,
-        "--onefile",
+        "--onefile" if onefile else "--onedir",
         "--add-data", f"src{os.pathsep}src",
         "--distpath", "dist",
         "--workpath", "build",
@@ -37,6 +41,10 @@ def build_executable():
     PyInstaller.__main__.run(cmd)
     
     print("Build completed! Executable is in dist/ directory")
+    executable = os.path.join("dist", APP_NAME) if onefile else os.path.join("dist", APP_NAME, APP_NAME)
+    print(f"Measure startup with: python src/startup_bench.py --command {executable}")
 
 if __name__ == "__main__":
-    build_executable()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build the game executable with PyInstaller")
+    parser.add_argument("--onefile", action="store_true", help="single-file executable (slower startup)")
+    build_executable(parser.parse_args().onefile)
\ No newline at end of file
@@ -0,0 +1,58 @@
+# Este código foi feito por Azam Usman
+import time
+import pygame
+
+class AssetManager:
+    # Fontes e superfícies estáticas: resolvidas uma única vez (na primeira utilização ou
+    # no aquecimento depois do primeiro frame) e reutilizadas em todos os frames
+    FONTS = {   # Nome -> (família, tamanho, negrito)
+        "title": ("arial", 72, True),
+        "menu": ("arial", 36, False),
+        "score": ("courier", 24, True),
+        "game_over": ("arial", 48, True),
+        "message": ("arial", 48, True),   # Mensagem de renascimento
+        "debug": ("courier", 16, False)   # Overlay do perfil de frames
+    }
+
+    def __init__(self):
+        self.assets = {}   # Chave -> recurso carregado
+        self.load_times = {}   # Chave -> tempo de carregamento (ms)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory):
+        # Devolve o recurso da chave, criando-o com factory() na primeira vez
+        asset = self.assets.get(key)
+        if asset is not None:
+            self.hits += 1
+            return asset
+        self.misses += 1
+        start = time.perf_counter()
+        asset = self.assets[key] = factory()
+        self.load_times[key] = (time.perf_counter() - start) * 1000
+        return asset
+
+    def font(self, name):
+        # Fonte do sistema pelo nome lógico (SysFont percorre a lista de fontes: é lento)
+        family, size, bold = self.FONTS[name]
+        return self.get(("font", family, size, bold), lambda: pygame.font.SysFont(family, size, bold=bold))
+
+    def overlay(self, size, color):
+        # Superfície translúcida de cor uniforme (ex.: escurecer o ecrã)
+        def create():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            return surface
+        return self.get(("overlay", tuple(size), tuple(color)), create)
+
+    def stats(self):
+        # Estatísticas de carregamento (para perfis e depuração)
+        slowest = max(self.load_times, key=self.load_times.get, default=None)
+        return {
+            "assets": len(self.assets),
+            "hits": self.hits,
+            "misses": self.misses,
+            "load_ms": sum(self.load_times.values()),
+            "slowest": slowest,
+            "slowest_ms": self.load_times.get(slowest, 0.0)
+        }
\ No newline at end of file
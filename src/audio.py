@@ -1,15 +1,112 @@
 # Este código foi feito por Azam Usman
+import numpy as np
 import pygame
+from config import Config
 
 class AudioManager:
+    # Efeitos sonoros sintetizados com NumPy (sem ficheiros) e tocados num conjunto fixo de canais.
+    # Tudo é criado uma vez em load(); play só escolhe um canal e começa a tocar (não bloqueia).
+    CHANNELS = 8   # Canais do conjunto (sons em simultâneo)
+    PRIORITIES = {   # Som -> prioridade (um som só rouba o canal de outro de prioridade igual ou menor)
+        "menu": 0,
+        "eat": 1,
+        "bomb": 2,
+        "death": 3
+    }
+
     def __init__(self):
-        pygame.mixer.init()
-        self.volume = 0.0  # Som desligado
-    
+        # O mixer só é iniciado quando for preciso (iniciá-lo atrasa o arranque)
+        self.config = Config.shared()
+        self.volume = self.config.volume
+        self.sounds = {}   # Nome -> pygame.mixer.Sound
+        self.channels = []   # Canais do conjunto
+        self.priority = []   # Prioridade do som em cada canal
+        self.started = []   # Ordem de início do som em cada canal (para roubar o mais antigo)
+        self.plays = 0   # Sons iniciados
+        self.available = True   # False se não há dispositivo de áudio
+        self.config.subscribe(self._on_config_change)   # Volume aplicado em tempo real
+
+    def _on_config_change(self, name, value):
+        if name == "volume":
+            self.set_volume(value)
+
+    def load(self):
+        # Inicia o mixer e sintetiza todos os sons (só com volume ligado; chamado depois do 1º frame)
+        if self.sounds or not self.available or self.volume <= 0:
+            return
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        except pygame.error:
+            self.available = False   # Sem dispositivo de áudio: o jogo continua em silêncio
+            return
+        pygame.mixer.set_num_channels(self.CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.CHANNELS)]
+        self.priority = [0] * self.CHANNELS
+        self.started = [0] * self.CHANNELS
+        rate, size, channels = pygame.mixer.get_init()
+        for name, wave in self._synthesize(rate).items():
+            self.sounds[name] = pygame.sndarray.make_sound(self._to_mixer_format(wave, size, channels))
+        self.set_volume(self.volume)
+
+    def _synthesize(self, rate):
+        # Formas de onda (float32 em -1..1) de cada som
+        def time(seconds):
+            return np.arange(int(rate * seconds), dtype=np.float32) / rate
+
+        def sweep(t, start, end):
+            # Seno com frequência a variar linearmente de start a end (Hz)
+            duration = t[-1] if len(t) > 1 else 1.0
+            return np.sin(2 * np.pi * (start * t + (end - start) * t * t / (2 * duration)))
+
+        rng = np.random.default_rng(0)   # Ruído igual em todas as execuções
+        t = time(0.09)
+        eat = sweep(t, 600, 1300) * np.exp(-t * 30)   # Subida curta
+        t = time(0.45)
+        noise = np.convolve(rng.uniform(-1, 1, len(t)), np.ones(12) / 12, mode="same")   # Ruído abafado
+        bomb = (noise * 2.5 + np.sin(2 * np.pi * 70 * t)) * np.exp(-t * 7)   # Explosão
+        t = time(0.8)
+        death = np.sign(sweep(t, 440, 90)) * 0.5 * (1 + np.sin(2 * np.pi * 8 * t)) * np.exp(-t * 3)   # Descida
+        t = time(0.035)
+        menu = np.sin(2 * np.pi * 880 * t) * np.minimum(1, (len(t) - np.arange(len(t))) / (rate * 0.01))   # Clique
+        return {"eat": eat * 0.5, "bomb": bomb * 0.6, "death": death * 0.35, "menu": menu * 0.3}
+
+    def _to_mixer_format(self, wave, size, channels):
+        # Converte para o formato do mixer (bits com/sem sinal ou float) e duplica pelos canais
+        wave = np.clip(wave, -1, 1)
+        if size == 32:
+            samples = wave.astype(np.float32)
+        else:
+            bits = abs(size)
+            peak = 2 ** (bits - 1) - 1
+            samples = np.round(wave * peak)
+            if size > 0:
+                samples += peak + 1   # Sem sinal: o silêncio fica a meio
+            samples = samples.astype({-8: np.int8, 8: np.uint8, -16: np.int16, 16: np.uint16}[size])
+        if channels > 1:
+            samples = np.repeat(samples[:, None], channels, axis=1)
+        return np.ascontiguousarray(samples)
+
     def play(self, name):
-        # Som desligado porque não há assets
-        pass
-    
+        # Toca o som num canal livre; com todos ocupados rouba o de menor prioridade (o mais antigo)
+        sound = self.sounds.get(name)
+        if sound is None or self.volume <= 0:
+            return
+        priority = self.PRIORITIES[name]
+        index = next((i for i, channel in enumerate(self.channels) if not channel.get_busy()), None)
+        if index is None:
+            index = min(range(self.CHANNELS), key=lambda i: (self.priority[i], self.started[i]))
+            if self.priority[index] > priority:
+                return   # Todos os canais têm sons mais importantes
+        self.plays += 1
+        self.priority[index] = priority
+        self.started[index] = self.plays
+        self.channels[index].play(sound)
+
     def set_volume(self, volume):
-        # Controle de volume desligado
-        pass
\ No newline at end of file
+        # Volume geral (0-1), aplicado também aos sons que estão a tocar
+        self.volume = volume
+        if volume > 0 and not self.sounds:
+            self.load()
+        for channel in self.channels:
+            channel.set_volume(volume)
\ No newline at end of file
@@ -1,17 +1,54 @@
 # Este código foi feito por Azam Usman
+import atexit
 import json
 import os
+import sys
+import tempfile
+import threading
+import time
 
 class Config:
-    def __init__(self):
-        # Configurações iniciais
+    # Tipos dos campos configuráveis (validados ao atribuir e ao carregar)
+    FIELD_TYPES = {
+        "screen_width": int,
+        "screen_height": int,
+        "grid_size": int,
+        "theme": str,
+        "difficulty": str,
+        "volume": float,
+        "high_scores": dict,
+        "base_speed": dict,
+        "speed_increment": float,
+        "max_speed": float,
+        "render_fps": int,
+        "max_ticks_per_frame": int,
+        "dirty_rects": bool,
+        "particle_budget": int,
+        "prewarm_themes": bool,
+        "world_cols": int,
+        "world_rows": int,
+        "profiler": bool,
+        "profile_csv": str,
+        "replay_dir": str
+    }
+    PERSISTED = ("theme", "difficulty", "volume", "high_scores")   # Campos gravados no ficheiro
+    SAVE_DELAY = 0.5   # Segundos sem alterações antes de gravar (várias mudanças seguidas = uma escrita)
+    _shared = None   # Instância única partilhada pelo processo (ver Config.shared)
+
+    def __init__(self, load=True):
+        # Configurações iniciais (load=False evita ler o disco, ex.: simulação headless)
+        object.__setattr__(self, "_subscribers", [])   # Funções chamadas quando um campo muda
+        object.__setattr__(self, "_save_cond", threading.Condition())   # Protege o pedido de gravação pendente
+        object.__setattr__(self, "_write_lock", threading.Lock())   # Uma escrita do ficheiro de cada vez
+        object.__setattr__(self, "_pending", None)   # Campos à espera de serem gravados
+        object.__setattr__(self, "_deadline", 0.0)   # Instante (monotonic) da gravação pendente
+        object.__setattr__(self, "_writer", None)   # Thread de gravação (criada na primeira gravação)
+        self.autosave = False   # Grava sozinho quando um campo de PERSISTED muda (ligado pelo jogo)
         self.screen_width = 1200
         self.screen_height = 800
         self.grid_size = 20
-        self.theme = "forest"   # Tema padrão
-        self.difficulty = "medium"   # Dificuldade padrão
-        self.volume = 0.0   # Volume inicial (mudo)
-        self.high_scores = {"classic": 0, "time_attack": 0, "survival": 0}   # Pontuações altas iniciais
+        self.world_cols = 0   # Colunas do mundo (0 = do tamanho da janela)
+        self.world_rows = 0   # Linhas do mundo (0 = do tamanho da janela)
         self.config_path = os.path.expanduser("~/.snake_game_config.json")   # Caminho para salvar configurações
         self.available_themes = ["forest", "neon", "sunset", "ocean"]   # Temas disponíveis
         self.base_speed = {   # Velocidade base por dificuldade
@@ -19,27 +56,152 @@ class Config:
             "medium": 12,
             "hard": 16
         }
+        self.theme = "forest"   # Tema padrão
+        self.difficulty = "medium"   # Dificuldade padrão
+        self.volume = 0.0   # Volume inicial (mudo)
+        self.high_scores = {"classic": 0, "time_attack": 0, "survival": 0}   # Pontuações altas iniciais
         self.speed_increment = 0.2   # Incremento de velocidade por comida
         self.max_speed = 30   # Velocidade máxima
-        self.load()   # Carregar configurações salvas
-    
+        self.render_fps = 60   # Frames por segundo do ecrã (independente da velocidade da cobra)
+        self.max_ticks_per_frame = 5   # Limite de ticks simulados por frame (evita a espiral da morte)
+        self.dirty_rects = True   # Ecrã de jogo: atualiza só os retângulos que mudaram
+        self.particle_budget = 20000   # Número máximo de partículas vivas
+        self.prewarm_themes = True   # Prepara fundos e sprites de todos os temas numa thread ao arrancar
+        self.profiler = False   # Perfil de frames ligado ao arrancar (F3 liga/desliga o overlay)
+        self.profile_csv = ""   # Ficheiro CSV para os tempos de cada frame ("" = não escrever)
+        self.replay_dir = ""   # Pasta onde gravar o replay de cada jogo terminado ("" = não gravar)
+        if load:
+            self.load()   # Carregar configurações salvas
+
+    @classmethod
+    def shared(cls):
+        # Configuração única do processo: lida do disco uma só vez e partilhada por todos
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def enable_autosave(self):
+        # Passa a gravar (em segundo plano) sempre que uma opção gravada muda; tudo o que estiver
+        # pendente é gravado à saída do processo
+        if not self.autosave:
+            self.autosave = True
+            self.subscribe(self._on_change)
+            atexit.register(self.flush)
+
+    def _on_change(self, name, value):
+        if name in self.PERSISTED:
+            self.save()
+
+    def subscribe(self, callback):
+        # Regista callback(nome, valor), chamado sempre que um campo muda de valor
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def _coerce(self, name, value):
+        # Valida o tipo (e os valores permitidos) de um campo configurável
+        expected = self.FIELD_TYPES[name]
+        if expected is float and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+            raise TypeError(f"{name} deve ser {expected.__name__}, não {type(value).__name__}")
+        if name == "theme" and value not in self.available_themes:
+            raise ValueError(f"Tema desconhecido: {value}")
+        if name == "difficulty" and value not in self.base_speed:
+            raise ValueError(f"Dificuldade desconhecida: {value}")
+        return value
+
+    def __setattr__(self, name, value):
+        # Atribuição validada que notifica os subscritores quando o valor muda
+        if name in self.FIELD_TYPES:
+            value = self._coerce(name, value)
+        changed = name in self.__dict__ and self.__dict__[name] != value
+        object.__setattr__(self, name, value)
+        if changed:
+            for callback in list(self._subscribers):
+                callback(name, value)
+
     def load(self):
-        # Carrega configurações de um arquivo se existir
-        if os.path.exists(self.config_path):
+        # Carrega configurações de um arquivo se existir. Um ficheiro ilegível é posto de lado
+        # (.corrupt) e ficam os valores por omissão; campos inválidos são ignorados um a um.
+        if not os.path.exists(self.config_path):
+            return
+        try:
             with open(self.config_path, 'r') as f:
                 data = json.load(f)
-                # Atualiza os atributos com os valores carregados, exceto available_themes
-                for key, value in data.items():
-                    if key == "available_themes": 
-                        continue  # Pula este, não carrega
+            if not isinstance(data, dict):
+                raise ValueError("o ficheiro não contém um objeto JSON")
+        except (OSError, ValueError) as error:
+            print(f"Configuração ilegível ({error}); a usar os valores por omissão", file=sys.stderr)
+            try:
+                os.replace(self.config_path, self.config_path + ".corrupt")
+            except OSError:
+                pass
+            return
+        # Atualiza apenas os campos conhecidos (available_themes e caminhos não são carregados)
+        for key, value in data.items():
+            if key in self.FIELD_TYPES:
+                try:
                     setattr(self, key, value)
-    
+                except (TypeError, ValueError) as error:
+                    print(f"Configuração: {error}; a usar o valor por omissão", file=sys.stderr)
+
     def save(self):
-        # Salva as configurações atuais no arquivo
-        with open(self.config_path, 'w') as f:
-            json.dump({
-                "theme": self.theme,
-                "difficulty": self.difficulty,
-                "volume": self.volume,
-                "high_scores": self.high_scores
-            }, f)
\ No newline at end of file
+        # Agenda a gravação das configurações atuais: só escreve SAVE_DELAY segundos depois da
+        # última chamada, na thread de gravação, para não parar o ecrã (ver flush)
+        snapshot = json.dumps({name: getattr(self, name) for name in self.PERSISTED})
+        with self._save_cond:
+            object.__setattr__(self, "_pending", snapshot)
+            object.__setattr__(self, "_deadline", time.monotonic() + self.SAVE_DELAY)
+            if self._writer is None:
+                writer = threading.Thread(target=self._write_loop, daemon=True)
+                object.__setattr__(self, "_writer", writer)
+                writer.start()
+            self._save_cond.notify()
+
+    def _write_loop(self):
+        # Thread de gravação: espera que o pedido pendente fique SAVE_DELAY segundos sem mudar
+        while True:
+            with self._save_cond:
+                while self._pending is None or time.monotonic() < self._deadline:
+                    self._save_cond.wait(None if self._pending is None else self._deadline - time.monotonic())
+            try:
+                self.flush()
+            except OSError as error:
+                print(f"Não foi possível gravar a configuração: {error}", file=sys.stderr)
+
+    def flush(self):
+        # Grava já o que estiver pendente (à saída do jogo); não faz nada se não houver alterações
+        with self._write_lock:   # Tirado antes do pedido: duas gravações nunca trocam de ordem
+            with self._save_cond:
+                snapshot = self._pending
+                object.__setattr__(self, "_pending", None)
+            if snapshot is not None:
+                self._write(snapshot)
+
+    def _write(self, text):
+        # Escrita atómica: ficheiro temporário na mesma pasta, fsync e rename por cima do antigo.
+        # Os campos de PERSISTED são fundidos no objeto já gravado: as chaves editadas à mão
+        # (world_cols, profiler, ...) mantêm-se.
+        data = {}
+        try:
+            with open(self.config_path, 'r') as f:
+                existing = json.load(f)
+            if isinstance(existing, dict):
+                data = existing
+        except (OSError, ValueError):
+            pass   # Sem ficheiro (ou ilegível, já posto de lado em load): começa vazio
+        data.update(json.loads(text))
+        text = json.dumps(data)
+        folder = os.path.dirname(self.config_path) or "."
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".snake_game_config.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
\ No newline at end of file
@@ -0,0 +1,150 @@
+# Este código foi feito por Azam Usman
+import argparse
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")   # Sem ecrã (CI); definido antes de iniciar o pygame
+import pygame
+from config import Config
+from renderer import Renderer
+from replay import Replay, make_simulation, iter_ticks
+
+# Exporta um replay para uma sequência de PNG ou um ficheiro de vídeo RGB24 em bruto, sem ecrã
+# e mais depressa do que o tempo real (os frames seguem os ticks, não o relógio).
+# Exemplo: python src/export.py jogo.snkr frames/ --fps 60 --workers 4
+#          python src/export.py jogo.snkr jogo.rgb --format raw
+#          ffmpeg -f rawvideo -pix_fmt rgb24 -s 1200x800 -r 60 -i jogo.rgb jogo.mp4
+
+PNG_LEVEL = 1   # Compressão zlib dos PNG (rápida; os frames são sobretudo cor lisa)
+
+def encode_png(data, width, height):
+    # PNG RGB de 8 bits a partir de bytes RGB contíguos (filtro 0 em todas as linhas)
+    stride = width * 3
+    raw = b"".join(b"\x00" + data[y * stride:(y + 1) * stride] for y in range(height))
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+    return (b"\x89PNG\r\n\x1a\n" +
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(raw, PNG_LEVEL)) +
+            chunk(b"IEND", b""))
+
+class FrameExporter:
+    # Fila limitada de frames (contrapressão: submit bloqueia quando cheia) consumida por
+    # threads codificadoras; zlib e a escrita em disco libertam o GIL
+    def __init__(self, path, size, fmt="png", workers=4, queue_size=16):
+        self.path = path
+        self.size = size
+        self.fmt = fmt
+        self.frames = 0   # Frames submetidos
+        self.error = None   # Primeira exceção de uma thread (relançada em close)
+        if fmt == "raw":
+            workers = 1   # Um único ficheiro: os frames têm de ser escritos por ordem
+            self.file = open(path, "wb")
+        else:
+            os.makedirs(path, exist_ok=True)
+        self.queue = queue.Queue(queue_size)
+        self.threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, data):
+        # Entrega os bytes RGB de um frame (cópia já feita: o ecrã é reutilizado a seguir)
+        self.queue.put((self.frames, data))
+        self.frames += 1
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            index, data = item
+            try:
+                if self.fmt == "raw":
+                    self.file.write(data)
+                else:
+                    with open(os.path.join(self.path, f"frame_{index:06d}.png"), "wb") as f:
+                        f.write(encode_png(data, *self.size))
+            except Exception as error:
+                self.error = self.error or error
+
+    def close(self):
+        # Espera que todos os frames sejam escritos
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.fmt == "raw":
+            self.file.close()
+        if self.error is not None:
+            raise self.error
+
+def export_replay(replay, exporter, fps=60, theme=None):
+    # Desenha o replay frame a frame numa superfície fora do ecrã e entrega cada frame ao exporter.
+    # fps > 0: passo fixo de 1/fps segundos simulados com interpolação (como o ciclo do jogo);
+    # fps = 0: um frame por tick. Devolve estatísticas de desempenho.
+    config = Config.shared()
+    sim = make_simulation(replay, config)   # Também aplica resolução e grade do replay à configuração
+    if theme:
+        config.theme = theme
+    pygame.init()
+    screen = pygame.Surface((config.screen_width, config.screen_height))
+    renderer = Renderer(screen)
+    ticks = iter_ticks(replay, sim)
+    start = time.perf_counter()
+    render_time = 0.0
+    accumulator = 0.0
+    running = True
+    while running:
+        if fps:
+            accumulator += 1.0 / fps
+            while accumulator >= 1.0 / sim.current_speed:
+                accumulator -= 1.0 / sim.current_speed
+                if next(ticks, None) is None:
+                    running = False
+                    break
+            alpha = min(1.0, accumulator * sim.current_speed)
+        else:
+            if next(ticks, None) is None:
+                break
+            alpha = None
+        frame_start = time.perf_counter()
+        renderer.draw_game(sim.view, alpha)
+        data = pygame.image.tobytes(screen, "RGB")   # Uma cópia contígua do frame
+        render_time += time.perf_counter() - frame_start
+        exporter.submit(data)
+    exporter.close()
+    elapsed = time.perf_counter() - start
+    return {
+        "frames": exporter.frames,
+        "ticks": sim.ticks,
+        "seconds": elapsed,
+        "fps": exporter.frames / elapsed if elapsed else 0.0,
+        "render_fps": exporter.frames / render_time if render_time else 0.0,
+        "realtime": (exporter.frames / fps) / elapsed if fps and elapsed else 0.0
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta um replay para PNG ou vídeo RGB24 sem ecrã")
+    parser.add_argument("replay", help="ficheiro .snkr")
+    parser.add_argument("output", help="pasta de PNG ou ficheiro .rgb (com --format raw)")
+    parser.add_argument("--format", choices=["png", "raw"], default="png")
+    parser.add_argument("--fps", type=int, default=60, help="frames por segundo de jogo (0 = um por tick)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="threads codificadoras")
+    parser.add_argument("--queue-size", type=int, default=16, help="frames em espera antes de bloquear")
+    parser.add_argument("--theme", help="tema a usar (por omissão o da configuração)")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay)
+    exporter = FrameExporter(args.output, (replay.config["screen_width"], replay.config["screen_height"]),
+                             args.format, args.workers, args.queue_size)
+    stats = export_replay(replay, exporter, args.fps, args.theme)
+    print(f"{stats['frames']} frames ({stats['ticks']} ticks) em {stats['seconds']:.1f}s: "
+          f"{stats['fps']:.0f} fps no total, {stats['render_fps']:.0f} fps a desenhar"
+          + (f", {stats['realtime']:.1f}x o tempo real" if args.fps else ""), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,35 +1,169 @@
 # Este código foi feito por Azam Usman
 import json
 import os
+import queue
+import sqlite3
+import threading
+import time
 
 class HighScoreManager:
-    def __init__(self):
-        self.file_path = os.path.expanduser("~/.snake_high_scores.json")   # Caminho do arquivo de pontuações
-        self.scores = self._load_scores()   # Carrega as pontuações
-    
-    def _load_scores(self):
-        # Carrega as pontuações do arquivo, se existir
-        if os.path.exists(self.file_path):
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        # Inicializa com zero para todos os modos
-        return {
-            "classic": 0, 
-            "time_attack": 0, 
-            "survival": 0
-        }
-    
-    def save_scores(self):
-        # Salva as pontuações no arquivo
-        with open(self.file_path, 'w') as f:
-            json.dump(self.scores, f)
-    
-    def update_score(self, mode, score):
-        # Atualiza a pontuação de um modo se for maior que a atual
-        if score > self.scores.get(mode, 0):
+    # Histórico de todos os jogos terminados em SQLite. As escritas e as consultas correm numa
+    # thread própria (dona da ligação); o jogo só lê memória: melhores pontuações, contagens e
+    # páginas já carregadas. Cada lote de escritas é uma transação atómica.
+    MODES = ("classic", "time_attack", "survival")
+    PAGE_SIZE = 10   # Entradas por página no ecrã de pontuações
+
+    def __init__(self, path=None):
+        self.file_path = path or os.path.expanduser("~/.snake_scores.db")   # Base de dados das pontuações
+        self.legacy_path = os.path.expanduser("~/.snake_high_scores.json")   # Formato antigo (importado uma vez)
+        self.scores = {mode: 0 for mode in self.MODES}   # Melhor pontuação por modo
+        self.counts = {}   # (modo, dificuldade) -> jogos registados
+        self.pages = {}   # (modo, dificuldade, página) -> lista de entradas
+        self.pending = {}   # Páginas pedidas à thread e ainda não carregadas -> geração do pedido
+        self.generation = 0   # Aumenta a cada jogo registado (descarta páginas pedidas antes)
+        self.lock = threading.Lock()   # Protege pages e pending
+        self.error = None   # Última exceção da thread de escrita
+        self._load()
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._work, daemon=True)
+        self.thread.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.file_path)
+        conn.execute("PRAGMA journal_mode=WAL")   # Leitores não bloqueiam o escritor
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _load(self):
+        # Cria o esquema, importa o ficheiro antigo e lê os resumos (uma vez, ao arrancar)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("""CREATE TABLE IF NOT EXISTS games (
+                    id INTEGER PRIMARY KEY,
+                    mode TEXT NOT NULL,
+                    difficulty TEXT,
+                    score INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    duration REAL NOT NULL,
+                    played_at REAL NOT NULL)""")
+                conn.execute("CREATE INDEX IF NOT EXISTS games_mode_top ON games (mode, score DESC)")
+                conn.execute("CREATE INDEX IF NOT EXISTS games_difficulty_top ON games (mode, difficulty, score DESC)")
+                empty = conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 0
+                if empty and os.path.exists(self.legacy_path):
+                    with open(self.legacy_path, 'r') as f:
+                        legacy = json.load(f)
+                    # Só se conhece a melhor pontuação de cada modo (sem dificuldade nem duração)
+                    conn.executemany(
+                        "INSERT INTO games (mode, difficulty, score, length, duration, played_at) VALUES (?, NULL, ?, 0, 0, ?)",
+                        [(mode, score, os.path.getmtime(self.legacy_path)) for mode, score in legacy.items() if score > 0])
+            for mode, difficulty, count, best in conn.execute(
+                    "SELECT mode, difficulty, COUNT(*), MAX(score) FROM games GROUP BY mode, difficulty"):
+                self.counts[(mode, difficulty)] = count
+                self.scores[mode] = max(self.scores.get(mode, 0), best)
+        finally:
+            conn.close()
+
+    def _work(self):
+        # Thread de escrita: junta os jogos pendentes numa só transação e responde aos pedidos de páginas
+        conn = self._connect()
+        while True:
+            item = self.queue.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            games = [args for kind, args in batch if kind == "insert"]
+            try:
+                if games:
+                    with conn:   # Commit atómico (rollback se falhar)
+                        conn.executemany(
+                            "INSERT INTO games (mode, difficulty, score, length, duration, played_at) VALUES (?, ?, ?, ?, ?, ?)",
+                            games)
+                for kind, args in batch:
+                    if kind == "page":
+                        self._fetch_page(conn, *args)
+                    elif kind == "flush":
+                        args.set()
+            except sqlite3.Error as error:
+                self.error = error
+            if item is None:
+                conn.close()
+                return
+
+    def _fetch_page(self, conn, key, generation):
+        mode, difficulty, page = key
+        if difficulty is None:
+            rows = conn.execute(
+                "SELECT score, difficulty, length, duration, played_at FROM games WHERE mode = ? "
+                "ORDER BY score DESC, id LIMIT ? OFFSET ?", (mode, self.PAGE_SIZE, page * self.PAGE_SIZE))
+        else:
+            rows = conn.execute(
+                "SELECT score, difficulty, length, duration, played_at FROM games WHERE mode = ? AND difficulty = ? "
+                "ORDER BY score DESC, id LIMIT ? OFFSET ?", (mode, difficulty, self.PAGE_SIZE, page * self.PAGE_SIZE))
+        entries = [{
+            "rank": page * self.PAGE_SIZE + i + 1,
+            "score": score,
+            "difficulty": entry_difficulty,
+            "length": length,
+            "duration": duration,
+            "played_at": played_at
+        } for i, (score, entry_difficulty, length, duration, played_at) in enumerate(rows)]
+        with self.lock:
+            if self.pending.get(key) == generation:   # Descartada se entretanto um jogo novo mudou a tabela
+                del self.pending[key]
+                self.pages[key] = entries
+
+    def record_game(self, mode, score, difficulty, length, duration):
+        # Regista um jogo terminado (escrito em segundo plano); devolve True se é um novo recorde
+        record = score > self.scores.get(mode, 0)
+        if record:
             self.scores[mode] = score
-            self.save_scores()
-    
+        self.counts[(mode, difficulty)] = self.counts.get((mode, difficulty), 0) + 1
+        with self.lock:
+            # As páginas deste modo mudaram de conteúdo: voltam a ser pedidas
+            self.generation += 1
+            self.pages = {key: entries for key, entries in self.pages.items() if key[0] != mode}
+            self.pending = {key: generation for key, generation in self.pending.items() if key[0] != mode}
+        self.queue.put(("insert", (mode, difficulty, score, length, duration, time.time())))
+        return record
+
+    def count(self, mode, difficulty=None):
+        # Jogos registados no modo (e dificuldade, se indicada)
+        if difficulty is not None:
+            return self.counts.get((mode, difficulty), 0)
+        return sum(count for (entry_mode, _), count in self.counts.items() if entry_mode == mode)
+
+    def page_count(self, mode, difficulty=None):
+        return max(1, -(-self.count(mode, difficulty) // self.PAGE_SIZE))
+
+    def get_page(self, mode, page, difficulty=None):
+        # Entradas da página (já ordenadas e numeradas) ou None enquanto está a ser carregada.
+        # Nunca espera pela base de dados: pede a página (e a seguinte) à thread de escrita.
+        with self.lock:
+            entries = self.pages.get((mode, difficulty, page))
+            pages = self.page_count(mode, difficulty)
+            for wanted in (page, page + 1):
+                key = (mode, difficulty, wanted)
+                if wanted < pages and key not in self.pages and key not in self.pending:
+                    self.pending[key] = self.generation
+                    self.queue.put(("page", (key, self.generation)))
+        return entries
+
     def get_scores(self):
-        # Retorna todas as pontuações
-        return self.scores
\ No newline at end of file
+        # Retorna a melhor pontuação de cada modo
+        return self.scores
+
+    def flush(self, timeout=None):
+        # Espera até todas as escritas pendentes estarem gravadas
+        done = threading.Event()
+        self.queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self):
+        # Grava o que falta e termina a thread de escrita (ao sair do jogo)
+        self.queue.put(None)
+        self.thread.join()
\ No newline at end of file
@@ -1,72 +1,127 @@
 # Este código foi feito por Azam Usman
+import time
+START_TIME = time.perf_counter()   # Início do processo (para medir o arranque)
+import argparse
+import json
+import os
 import pygame
 import sys
-import time
 from game import SnakeGame
 from menu import MenuSystem
 from renderer import Renderer
 from audio import AudioManager
 from highscore import HighScoreManager
 from config import Config
+from profiler import FrameProfiler
+IMPORT_TIME = time.perf_counter()   # Fim dos imports
 
-def main():
-    pygame.init()
+def save_replay(game, folder, mode):
+    # Grava o replay do jogo terminado (uma falha do disco não interrompe o jogo)
+    stamp = time.time()
+    folder = os.path.expanduser(folder)
+    path = os.path.join(folder, f"{mode}-{time.strftime('%Y%m%d-%H%M%S', time.localtime(stamp))}-{int(stamp * 1000) % 1000:03d}.snkr")
+    try:
+        os.makedirs(folder, exist_ok=True)
+        game.save_replay(path)
+    except OSError as error:
+        print(f"Não foi possível gravar o replay {path}: {error}", file=sys.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ultimate Snake Game")
+    parser.add_argument("--exit-after-first-frame", action="store_true",
+                        help="mede o arranque: escreve os tempos em JSON e sai depois do primeiro frame")
+    args = parser.parse_args(argv)
+    
+    # Só os módulos usados no primeiro frame (pygame.init também iniciaria o mixer, que é lento)
+    pygame.display.init()
+    pygame.font.init()
     pygame.display.set_caption("Ultimate Snake Game")
     
-    config = Config()   # Configurações
+    config = Config.shared()   # Configurações (instância única, partilhada com os outros módulos)
+    config.enable_autosave()   # Opções gravadas em segundo plano quando mudam
     screen = pygame.display.set_mode((config.screen_width, config.screen_height))   # Tela
     clock = pygame.time.Clock()   # Relógio para controlar FPS
     
     game = SnakeGame()   # Inicializa o jogo
+    state = game.state   # Vista do estado (mesmo objeto em todos os frames)
     menu = MenuSystem()   # Sistema de menu
-    renderer = Renderer(screen)   # Renderizador
-    audio = AudioManager()   # Áudio (desligado)
+    profiler = FrameProfiler()   # Tempos de cada fase do frame (F3)
+    profiler.enable(config.profiler)
+    if config.profile_csv:
+        profiler.open_csv(config.profile_csv)
+    renderer = Renderer(screen, profiler)   # Renderizador
+    audio = AudioManager()   # Efeitos sonoros (sintetizados depois do primeiro frame)
     high_scores = HighScoreManager()   # Gerenciador de pontuações
     
     game_state = "menu"   # Estado inicial: menu
+    frame_dt = 0.0   # Duração real do último frame (s)
+    accumulator = 0.0   # Tempo real ainda não simulado (passo fixo de 1/velocidade)
     current_mode = "classic"   # Modo atual
-    last_time = time.time()   # Tempo do último frame
+    play_time = 0.0   # Tempo de jogo da partida atual (s), sem as pausas de renascimento
+    scores_mode = "classic"   # Modo mostrado no ecrã de pontuações
+    scores_page = 0   # Página mostrada no ecrã de pontuações
+    
+    # Trabalho adiado para depois do primeiro frame, um passo por frame (o menu aparece logo)
+    warmups = [renderer.particle_system.prepare, renderer.load_theme_assets, audio.load]
+    warmups += [lambda name=name: renderer.assets.font(name) for name in renderer.assets.FONTS]
+    if config.prewarm_themes:
+        warmups.append(renderer.prewarm_themes)   # Outros temas preparados em segundo plano
+    first_frame = True
     
     while True:
-        # Calcula delta time (tempo entre frames)
-        current_time = time.time()
-        dt = current_time - last_time
-        last_time = current_time
-        mouse_pos = pygame.mouse.get_pos()   # Posição do mouse
+        profiler.begin_frame()
+        events = pygame.event.get()   # Lidos logo antes dos ticks deste frame (depois da espera do relógio)
+        sampled = time.perf_counter_ns()   # Instante da leitura das teclas (latência da entrada)
+        profiler.mark("events")
         
         # Trata eventos
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
-                config.save()   # Salva configurações
+                config.flush()   # Grava as configurações pendentes
+                high_scores.close()   # Grava os jogos ainda pendentes
+                profiler.close_csv()
                 pygame.quit()
                 sys.exit()
             
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()   # Liga/desliga o perfil e o overlay
+                renderer.invalidate()
+                continue
+            
             if game_state == "menu":
                 # Trata entrada no menu
-                action = menu.handle_input(event, mouse_pos)
+                selected = menu.get_selected_index()
+                action = menu.handle_input(event)
+                if action or menu.get_selected_index() != selected:
+                    audio.play("menu")
                 if action:
                     if action.get("action") == "start_game":
                         game.reset(action["mode"])   # Começa o jogo no modo escolhido
+                        accumulator = 0.0
+                        play_time = 0.0
                         game_state = "playing"
                         current_mode = action["mode"]
                     elif action.get("action") == "quit":
-                        config.save()
+                        config.flush()
+                        high_scores.close()
+                        profiler.close_csv()
                         pygame.quit()
                         sys.exit()
                     elif action.get("action") == "show_scores":
                         game_state = "scores"   # Mostra pontuações
+                        scores_mode = current_mode
+                        scores_page = 0
                     elif action.get("action") == "theme_changed":
                         # Tema mudou, não precisa de ação especial
                         pass
             
             elif game_state == "playing":
-                state = game.get_state()
-                if state["waiting_for_respawn"]:
+                if state.waiting_for_respawn:
                     # Esperando renascer: qualquer tecla reinicia
                     if event.type == pygame.KEYDOWN:
                         game.trigger_respawn()
                 else:
-                    game.handle_input(event)   # Passa entrada para o jogo
+                    game.handle_input(event, sampled)   # Viragem posta na fila (uma por tick)
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                         game_state = "menu"   # Volta ao menu
             
@@ -74,67 +129,112 @@ def main():
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
                         game_state = "menu"   # Volta ao menu
+                    elif game_state == "scores" and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                        # Muda de modo (volta à primeira página)
+                        modes = list(high_scores.get_scores())
+                        step = 1 if event.key == pygame.K_RIGHT else -1
+                        scores_mode = modes[(modes.index(scores_mode) + step) % len(modes)]
+                        scores_page = 0
+                    elif game_state == "scores" and event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_PAGEUP, pygame.K_PAGEDOWN):
+                        step = -1 if event.key in (pygame.K_UP, pygame.K_PAGEUP) else 1
+                        scores_page = min(max(0, scores_page + step), high_scores.page_count(scores_mode) - 1)
+        profiler.mark("input")
         
-        # Atualiza estado do jogo
+        # Atualiza estado do jogo com passo fixo: um tick a cada 1/velocidade segundos reais
         if game_state == "playing":
-            state = game.get_state()
-            if not state["waiting_for_respawn"]:
-                game.update(dt)   # Atualiza o jogo
-                state = game.get_state()
-                if state["game_over"]:
+            if state.waiting_for_respawn:
+                accumulator = 0.0
+            else:
+                accumulator += frame_dt
+                play_time += frame_dt
+                score, lives = state.score, state.lives
+                ticks = 0
+                while (accumulator >= 1.0 / state.current_speed and ticks < config.max_ticks_per_frame
+                       and not state.game_over and not state.waiting_for_respawn):
+                    accumulator -= 1.0 / state.current_speed
+                    game.tick()   # Um movimento da cobra
+                    ticks += 1
+                if ticks == config.max_ticks_per_frame:
+                    # Engasgo longo: descarta o atraso em vez de o tentar recuperar
+                    accumulator = min(accumulator, 1.0 / state.current_speed)
+                if state.score > score:
+                    audio.play("eat")
+                if state.lives < lives and not state.game_over:
+                    audio.play("bomb")   # Perdeu uma vida (modo survival)
+                if state.game_over:
                     # Atualiza pontuação e vai para tela de game over
-                    high_scores.update_score(current_mode, state["score"])
+                    high_scores.record_game(current_mode, state.score, config.difficulty, len(state.snake), play_time)
+                    if config.replay_dir:
+                        save_replay(game, config.replay_dir, current_mode)
                     game_state = "game_over"
-                    audio.play("game_over")   # Som de game over (desligado)
+                    audio.play("death")
+        profiler.mark("update")
         
-        # Renderiza
+        # Renderiza (dirty = retângulos alterados, ou None para atualizar o ecrã inteiro)
+        dirty = None
         if game_state == "menu":
-            renderer.draw_menu(menu.get_current_menu(), menu.get_selected_index())
+            dirty = renderer.draw_menu(menu.get_current_menu(), menu.get_selected_index(), menu.hit_index)
         elif game_state == "playing":
-            state = game.get_state()
-            if state["waiting_for_respawn"]:
+            if state.waiting_for_respawn:
                 # Desenha o jogo pausado e mensagem de renascimento
-                renderer.draw_game(
-                    state["snake"], 
-                    state["food"], 
-                    state["bombs"],
-                    state["score"],
-                    state["mode"],
-                    state["time_remaining"],
-                    state["max_time"],
-                    state["lives"]
-                )
-                renderer.draw_waiting_for_respawn(state["lives"])
+                renderer.draw_game(state)
+                renderer.draw_waiting_for_respawn(state.lives)
             else:
-                # Desenha o jogo normalmente
-                renderer.draw_game(
-                    state["snake"], 
-                    state["food"], 
-                    state["bombs"],
-                    state["score"],
-                    state["mode"],
-                    state["time_remaining"],
-                    state["max_time"],
-                    state["lives"]
-                )
+                # Desenha o jogo normalmente, interpolado entre o último tick e o próximo
+                dirty = renderer.draw_game(state, min(1.0, accumulator * state.current_speed))
         elif game_state == "game_over":
-            state = game.get_state()
             renderer.draw_game_over(
-                state["score"], 
+                state.score, 
                 high_scores.get_scores()[current_mode],
                 current_mode
             )
         elif game_state == "scores":
-            renderer.draw_high_scores(high_scores.get_scores())
+            renderer.draw_high_scores(
+                high_scores.get_scores(),
+                scores_mode,
+                scores_page,
+                high_scores.page_count(scores_mode),
+                high_scores.get_page(scores_mode, scores_page)
+            )
+        profiler.mark("draw")
         
-        pygame.display.flip()   # Atualiza a tela
+        if profiler.enabled:
+            rect = renderer.draw_profiler()
+            if dirty is not None and rect is not None:
+                dirty.append(rect)
+            profiler.mark("overlay")
         
-        # Controla a velocidade do jogo
-        if game_state == "playing":
-            state = game.get_state()
-            clock.tick(state["current_speed"])   # Usa a velocidade atual da cobra
+        if dirty is None:
+            pygame.display.flip()   # Atualiza a tela
         else:
-            clock.tick(60)   # 60 FPS no menu
+            pygame.display.update(dirty)   # Só as zonas que mudaram
+        profiler.mark("flip")
+        
+        # Latência da entrada: da leitura da tecla até ao ecrã mostrar o movimento
+        if game.applied_turns:
+            shown = time.perf_counter_ns()
+            for stamp in game.applied_turns:
+                profiler.sample("input->move", shown - stamp)
+            game.applied_turns.clear()
+        
+        if first_frame:
+            first_frame = False
+            profiler.startup = {
+                "imports_ms": (IMPORT_TIME - START_TIME) * 1000,
+                "first_frame_ms": (time.perf_counter() - START_TIME) * 1000
+            }
+            if args.exit_after_first_frame:
+                print(json.dumps(profiler.startup))
+                high_scores.close()
+                pygame.quit()
+                return
+        elif warmups:
+            warmups.pop(0)()
+        
+        # Renderiza à taxa do ecrã; a simulação segue o seu próprio passo fixo
+        frame_dt = clock.tick(config.render_fps) / 1000.0
+        profiler.mark("idle")
+        profiler.end_frame()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
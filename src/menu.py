@@ -1,10 +1,11 @@
 # Este código foi feito por Azam Usman
 import pygame
 from config import Config
+from ui import HitIndex
 
 class MenuSystem:
     def __init__(self):
-        self.config = Config()   # Configurações
+        self.config = Config.shared()   # Configurações partilhadas
         self.main_menu = [   # Itens do menu principal
             "Play Classic",
             "Time Attack",
@@ -16,7 +17,13 @@ class MenuSystem:
         self.update_options_menu()   # Atualiza o menu de opções
         self.current_menu = "main"   # Menu atual
         self.selected_index = 0   # Índice do item selecionado
-        self.menu_items_rects = []   # Retângulos dos itens para interação com mouse
+        self.hit_index = HitIndex()   # Áreas dos itens desenhados (preenchidas pelo Renderer)
+        self.config.subscribe(self._on_config_change)   # Mantém o menu de opções atualizado
+    
+    def _on_config_change(self, name, value):
+        # Atualiza os rótulos quando uma opção muda (venha a mudança de onde vier)
+        if name in ("difficulty", "theme", "volume"):
+            self.update_options_menu()
     
     def update_options_menu(self):
         # Atualiza os itens do menu de opções com os valores atuais
@@ -31,14 +38,14 @@ class MenuSystem:
             "options": self.options_menu
         }
     
-    def handle_input(self, event, mouse_pos=None):
-        # Trata entrada do mouse
-        if mouse_pos:
-            for i, rect in enumerate(self.menu_items_rects):
-                if rect.collidepoint(mouse_pos):
-                    self.selected_index = i   # Seleciona o item sob o mouse
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        return self._handle_selection()   # Clicou
+    def handle_input(self, event):
+        # Trata entrada do mouse (consulta as áreas dos itens desenhados no último frame)
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            index = self.hit_index.hit(event.pos)
+            if index is not None and index < len(self.menus[self.current_menu]):
+                self.selected_index = index   # Seleciona o item sob o mouse
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    return self._handle_selection()   # Clicou
         
         # Trata entrada do teclado
         if event.type == pygame.KEYDOWN:
@@ -84,9 +91,8 @@ class MenuSystem:
             elif self.selected_index == 3:  # Back
                 self.current_menu = "main"
                 self.selected_index = 3
-                self.config.save()   # Salva configurações
+                self.config.save()   # Agenda a gravação das configurações (em segundo plano)
             
-            self.update_options_menu()   # Atualiza o menu de opções com novos valores
             return {"action": "theme_changed"}   # Indica que o tema pode ter mudado
     
     def get_current_menu(self):
@@ -1,49 +1,117 @@
 # Este código foi feito por Azam Usman
+import numpy as np
 import pygame
-import random
-
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color   # Cor base
-        self.size = random.randint(2, 5)   # Tamanho inicial
-        self.life = random.randint(20, 40)   # Tempo de vida (frames)
-        self.vx = random.uniform(-2, 2)   # Velocidade x
-        self.vy = random.uniform(-2, 2)   # Velocidade y
-        self.gravity = 0.1   # Gravidade (puxa para baixo)
-    
-    def update(self):
-        # Atualiza a posição e estado da partícula
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.life -= 1
-        self.size = max(0, self.size - 0.05)   # Diminui o tamanho
-        return self.life > 0   # Retorna se ainda está viva
-    
-    def draw(self, screen):
-        # Desenha a partícula com transparência baseada na vida
-        alpha = min(255, self.life * 6)   # Alpha diminui com a vida
-        color = (*self.color, int(alpha))
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (self.size, self.size), self.size)
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+from config import Config
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []   # Lista de partículas
-    
+    # Partículas guardadas em arrays NumPy (estrutura de arrays) com capacidade fixa:
+    # as vivas ocupam sempre as primeiras `count` posições e são atualizadas todas de uma vez
+    GRAVITY = 0.1   # Gravidade (puxa para baixo)
+    SHRINK = 0.05   # Diminuição do tamanho por frame
+    MAX_DIAMETER = 10   # Tamanho inicial máximo (5) * 2
+    ALPHA_LEVELS = 16   # Níveis de transparência pré-desenhados
+    MAX_RECTS = 64   # Acima disto draw devolve um único retângulo envolvente
+
+    def __init__(self, capacity=None, seed=None):
+        self.capacity = capacity if capacity is not None else Config.shared().particle_budget   # Limite rígido
+        self.count = 0   # Partículas vivas
+        self.seed = seed
+        self.rng = None   # Gerador aleatório, criado na primeira utilização (ver prepare)
+        self.x = np.zeros(self.capacity, dtype=np.float32)
+        self.y = np.zeros(self.capacity, dtype=np.float32)
+        self.vx = np.zeros(self.capacity, dtype=np.float32)
+        self.vy = np.zeros(self.capacity, dtype=np.float32)
+        self.size = np.zeros(self.capacity, dtype=np.float32)
+        self.life = np.zeros(self.capacity, dtype=np.int32)   # Frames restantes
+        self.color = np.zeros(self.capacity, dtype=np.int32)   # Índice na paleta
+        self.palette = {}   # Cor -> índice
+        self.sprites = []   # Tabela plana: (cor, diâmetro, nível de alfa) -> superfície
+
+    def prepare(self):
+        # Cria o gerador aleatório (a primeira vez importa numpy.random, que é lento)
+        if self.rng is None:
+            self.rng = np.random.default_rng(self.seed)
+
+    def _color_index(self, color):
+        # Regista a cor e pré-desenha os seus sprites (todos os diâmetros e níveis de alfa)
+        color = tuple(color)
+        index = self.palette.get(color)
+        if index is None:
+            index = self.palette[color] = len(self.palette)
+            for diameter in range(self.MAX_DIAMETER + 1):
+                for level in range(self.ALPHA_LEVELS):
+                    surf = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+                    alpha = (level + 1) * 256 // self.ALPHA_LEVELS - 1
+                    pygame.draw.circle(surf, (*color, alpha), (diameter / 2, diameter / 2), diameter / 2)
+                    self.sprites.append(surf)
+        return index
+
     def add_particles(self, x, y, color, count=5):
-        # Adiciona novas partículas
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
-    
+        # Adiciona novas partículas (as que excedem a capacidade são ignoradas)
+        start = self.count
+        end = min(self.capacity, start + count)
+        n = end - start
+        if n <= 0:
+            return
+        self.prepare()
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = self.rng.uniform(-2, 2, n)   # Velocidade x
+        self.vy[start:end] = self.rng.uniform(-2, 2, n)   # Velocidade y
+        self.size[start:end] = self.rng.integers(2, 6, n)   # Tamanho inicial
+        self.life[start:end] = self.rng.integers(20, 41, n)   # Tempo de vida (frames)
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+
     def update(self):
-        # Atualiza todas as partículas e remove as mortas
-        self.particles = [p for p in self.particles if p.update()]
-    
+        # Atualiza todas as partículas num só passo e compacta as vivas no início dos arrays
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.GRAVITY
+        self.life[:n] -= 1
+        np.maximum(self.size[:n] - self.SHRINK, 0, out=self.size[:n])
+        alive = self.life[:n] > 0
+        k = int(np.count_nonzero(alive))
+        if k < n:
+            for array in (self.x, self.y, self.vx, self.vy, self.size, self.life, self.color):
+                array[:k] = array[:n][alive]
+        self.count = k
+
+    def _visible(self, screen):
+        # Índices, diâmetro e canto das partículas com tamanho e dentro do ecrã (caem com a gravidade)
+        n = self.count
+        diameter = (self.size[:n] * 2).astype(np.int32)
+        left = (self.x[:n] - self.size[:n]).astype(np.int32)
+        top = (self.y[:n] - self.size[:n]).astype(np.int32)
+        width, height = screen.get_size()
+        visible = (diameter > 0) & (left < width) & (top < height) & (left + diameter > 0) & (top + diameter > 0)
+        return visible, diameter[visible], left[visible], top[visible]
+
+    def bounds(self, screen):
+        # Retângulos que draw vai afetar, sem desenhar (para apagar a área antes)
+        visible, diameter, left, top = self._visible(screen)
+        if len(diameter) <= self.MAX_RECTS:
+            return [pygame.Rect(x, y, d, d) for x, y, d in zip(left.tolist(), top.tolist(), diameter.tolist())]
+        # Muitas partículas: um retângulo envolvente é mais barato do que milhares de pequenos
+        rect = pygame.Rect(int(left.min()), int(top.min()), 0, 0)
+        rect.width = int((left + diameter).max()) - rect.x
+        rect.height = int((top + diameter).max()) - rect.y
+        return [rect.clip(screen.get_rect())]
+
     def draw(self, screen):
-        # Desenha todas as partículas
-        for p in self.particles:
-            p.draw(screen)
\ No newline at end of file
+        # Desenha todas as partículas com um único blits e devolve os retângulos afetados
+        visible, diameter, left, top = self._visible(screen)
+        n = len(diameter)
+        if n == 0:
+            return []
+        alpha = np.minimum(255, self.life[:self.count][visible] * 6)   # Alpha diminui com a vida
+        level = alpha * self.ALPHA_LEVELS // 256
+        keys = (self.color[:self.count][visible] * (self.MAX_DIAMETER + 1) + diameter) * self.ALPHA_LEVELS + level
+        sequence = zip(map(self.sprites.__getitem__, keys.tolist()), zip(left.tolist(), top.tolist()))
+        if n <= self.MAX_RECTS:
+            return screen.blits(sequence)
+        screen.blits(sequence, doreturn=False)
+        return self.bounds(screen)
\ No newline at end of file
@@ -0,0 +1,128 @@
+# Este código foi feito por Azam Usman
+import csv
+import time
+import numpy as np
+
+class FrameProfiler:
+    # Tempo de cada fase do frame (perf_counter_ns), por voltas: mark(fase) atribui à fase o tempo
+    # decorrido desde a marca anterior. Guarda os últimos `window` frames de cada fase para os
+    # percentis e pode escrever cada frame num CSV. Desligado, mark não faz nada.
+    WINDOW = 240   # Frames na janela dos percentis (4 s a 60 fps)
+    REFRESH = 0.5   # Segundos entre atualizações do relatório do overlay
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.enabled = False
+        self.samples = {}   # Fase -> array circular de durações (ns)
+        self.counts = {}   # Fase -> amostras registadas
+        self.current = {}   # Fase -> ns acumulados no frame atual
+        self.frames = 0   # Frames completos registados
+        self.csv_file = None
+        self.csv_writer = None
+        self._last = 0   # Instante da última marca (ns)
+        self._report = []   # Linhas do último relatório
+        self._report_time = 0.0
+        self.startup = {}   # Tempos de arranque (ms), preenchidos pelo jogo depois do primeiro frame
+        self.caches = {}   # Nome -> função que devolve as estatísticas de uma cache (mostradas no relatório)
+        self.mark = self._skip
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+        self.mark = self._mark if enabled else self._skip
+        self.current = {}
+        self._last = time.perf_counter_ns()
+
+    def toggle(self):
+        self.enable(not self.enabled)
+
+    def open_csv(self, path):
+        # Escreve cada frame no ficheiro: frame, fase, microssegundos (uma linha por fase)
+        self.close_csv()
+        self.csv_file = open(path, "w", newline="")
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(("frame", "phase", "us"))
+
+    def close_csv(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = self.csv_writer = None
+
+    def _skip(self, phase):
+        pass
+
+    def _mark(self, phase):
+        now = time.perf_counter_ns()
+        self.current[phase] = self.current.get(phase, 0) + now - self._last
+        self._last = now
+
+    def sample(self, phase, ns):
+        # Regista uma medida avulsa (ex.: latência da entrada), fora do total do frame
+        if self.enabled:
+            self._store(phase, ns)
+            if self.csv_writer is not None:
+                self.csv_writer.writerow((self.frames, phase, ns // 1000))
+
+    def _store(self, phase, ns):
+        ring = self.samples.get(phase)
+        if ring is None:
+            ring = self.samples[phase] = np.zeros(self.window, dtype=np.int64)
+            self.counts[phase] = 0
+        ring[self.counts[phase] % self.window] = ns
+        self.counts[phase] += 1
+
+    def begin_frame(self):
+        if self.enabled:
+            self.current = {}
+            self._last = time.perf_counter_ns()
+
+    def end_frame(self):
+        # Fecha o frame: regista cada fase e o total ("frame")
+        if not self.enabled:
+            return
+        current = self.current
+        current["frame"] = sum(current.values())
+        for phase, ns in current.items():
+            self._store(phase, ns)
+        if self.csv_writer is not None:
+            self.csv_writer.writerows((self.frames, phase, ns // 1000) for phase, ns in current.items())
+        self.frames += 1
+        self.current = {}
+
+    def percentiles(self, phase, points=(50, 95, 99)):
+        # Percentis (ms) da fase na janela atual
+        ring = self.samples.get(phase)
+        if ring is None:
+            return tuple(0.0 for _ in points)
+        filled = ring[:min(self.counts[phase], self.window)]
+        return tuple(value / 1e6 for value in np.percentile(filled, points))
+
+    def summary(self):
+        # Fase -> (p50, p95, p99) em ms
+        return {phase: self.percentiles(phase) for phase in self.samples}
+
+    def report(self):
+        # Linhas de texto para o overlay (recalculadas no máximo a cada REFRESH segundos)
+        now = time.perf_counter()
+        if now - self._report_time >= self.REFRESH:
+            self._report_time = now
+            self._report = [f"{'fase':<16}{'p50':>7}{'p95':>7}{'p99':>7} ms"] + [
+                f"{phase:<16}{p50:7.2f}{p95:7.2f}{p99:7.2f}"
+                for phase, (p50, p95, p99) in self.summary().items()
+            ]
+            if self.startup:
+                self._report.append(f"arranque: imports {self.startup['imports_ms']:.0f} ms, "
+                                    f"1º frame {self.startup['first_frame_ms']:.0f} ms")
+            self._report.extend(self._cache_line(name, stats()) for name, stats in self.caches.items())
+        return self._report
+
+    def _cache_line(self, name, stats):
+        # Acertos e falhas de uma cache, mais os campos próprios de cada tipo
+        total = stats["hits"] + stats["misses"]
+        line = f"{name}: {stats['hits'] / total if total else 0.0:.0%} de {total} pedidos"
+        if "evictions" in stats:
+            line += f", {stats['entries']}/{stats['capacity']} entradas, {stats['evictions']} despejos"
+        if "load_ms" in stats:
+            line += f", {stats['assets']} carregados em {stats['load_ms']:.0f} ms"
+            if stats["slowest"] is not None:
+                line += f" (mais lento: {stats['slowest'][0]} {stats['slowest_ms']:.0f} ms)"
+        return line
\ No newline at end of file
@@ -2,27 +2,38 @@
 import pygame
 import random
 import math
+import threading
 from config import Config
 from particle import ParticleSystem
+from textcache import TextCache
+from assets import AssetManager
+from ui import UILayer, Panel, Label, Button
+from profiler import FrameProfiler
 
 class Renderer:
-    def __init__(self, screen):
+    GRADIENT_STEPS = 64   # Tons pré-desenhados no gradiente da cobra
+    CHUNK_CELLS = 32   # Lado (em células, par) de cada bloco do fundo no modo câmara
+    
+    def __init__(self, screen, profiler=None):
         self.screen = screen   # Superfície para desenhar
-        self.config = Config()   # Configurações
+        self.profiler = profiler or FrameProfiler()   # Tempos das fases do desenho (desligado por omissão)
+        self.config = Config.shared()   # Configurações partilhadas
         self.particle_system = ParticleSystem()   # Sistema de partículas
         self.themes = self._load_themes()   # Carrega temas
-        self.current_theme = self.config.theme   # Tema atual
-        self.background = self._create_background()   # Cria o fundo
-        self.fonts = self._create_fonts()   # Cria as fontes
-    
-    def _create_fonts(self):
-        # Cria dicionário de fontes
-        return {
-            "title": pygame.font.SysFont("arial", 72, bold=True),
-            "menu": pygame.font.SysFont("arial", 36),
-            "score": pygame.font.SysFont("courier", 24, bold=True),
-            "game_over": pygame.font.SysFont("arial", 48, bold=True)
-        }
+        self.assets = AssetManager()   # Fontes e superfícies estáticas (carregadas uma vez)
+        self._background = None   # Fundo do tema atual (criado no primeiro ecrã de jogo)
+        self._sprites = None   # Sprites do tema atual (idem)
+        self.text = TextCache()   # Superfícies de texto já rasterizadas (LRU)
+        self.profiler.caches["texto"] = self.text.stats
+        self.profiler.caches["recursos"] = self.assets.stats
+        self._full_redraw = True   # Modo dirty_rects: próximo draw_game redesenha tudo
+        self._static_cells = {}   # Segmentos estáticos desenhados: posição -> sprite
+        self._static_key = None   # (versão, interpolação, comprimento) do corpo desenhado
+        self._transient_rects = []   # Retângulos a apagar no próximo frame
+        self._menu_ui = None   # Widgets do menu (ui.UILayer); None = reconstruir e pintar tudo
+        self._menu_buttons = []
+        self._menu_particles = []   # Retângulos das partículas do menu no último frame
+        self.config.subscribe(self._on_config_change)   # Reage a mudanças de tema
     
     def _load_themes(self):
         # Define as cores para cada tema
@@ -69,108 +80,333 @@ class Renderer:
             }
         }
     
-    def _create_background(self):
-        # Cria uma superfície de fundo com grade
-        bg = pygame.Surface((self.config.screen_width, self.config.screen_height))
-        theme = self.themes[self.config.theme]
+    def _create_background(self, name, width=None, height=None):
+        # Cria a superfície de fundo do tema com a grade em xadrez: desenha um bloco de 2x2 células
+        # e replica-o duplicando a área já pronta (poucos blits, em vez de um retângulo por célula)
+        width = width or self.config.screen_width
+        height = height or self.config.screen_height
+        grid = self.config.grid_size
+        theme = self.themes[name]
+        bg = pygame.Surface((width, height))
         bg.fill(theme["bg"])
+        pygame.draw.rect(bg, theme["grid"], (0, 0, grid, grid), 1)
+        pygame.draw.rect(bg, theme["grid"], (grid, grid, grid, grid), 1)
+        span = 2 * grid
+        while span < width:
+            bg.blit(bg, (span, 0), (0, 0, span, 2 * grid))
+            span *= 2
+        span = 2 * grid
+        while span < height:
+            bg.blit(bg, (0, span), (0, 0, width, span))
+            span *= 2
         
-        # Desenha padrão de grade
-        for y in range(0, self.config.screen_height, self.config.grid_size):
-            for x in range(0, self.config.screen_width, self.config.grid_size):
-                if (x//self.config.grid_size + y//self.config.grid_size) % 2 == 0:
-                    pygame.draw.rect(
-                        bg, 
-                        theme["grid"], 
-                        (x, y, self.config.grid_size, self.config.grid_size),
-                        1
-                    )
+        # Células cortadas na última coluna/linha: pygame.draw.rect contorna a parte visível
+        last_x, last_y = (width - 1) // grid * grid, (height - 1) // grid * grid
+        edges = []
+        if width % grid:
+            edges += [(last_x, y) for y in range(0, height, grid)]
+        if height % grid:
+            edges += [(x, last_y) for x in range(0, width, grid)]
+        for x, y in edges:
+            if (x//grid + y//grid) % 2 == 0:
+                pygame.draw.rect(bg, theme["grid"], (x, y, grid, grid), 1)
         return bg
     
-    def check_theme_change(self):
-        # Verifica se o tema mudou e recria o fundo
-        if self.config.theme != self.current_theme:
-            self.current_theme = self.config.theme
-            self.background = self._create_background()
+    def _on_config_change(self, name, value):
+        # Troca o fundo quando o tema muda (notificado pela Config partilhada)
+        if name == "theme":
+            self._background = self._sprites = None
+            self.invalidate()
     
-    def draw_game(self, snake, food, bombs, score, mode, time_remaining=0, max_time=0, lives=0):
-        # Desenha o estado do jogo
-        self.check_theme_change()
-        self.screen.blit(self.background, (0, 0))   # Fundo
+    def load_theme_assets(self):
+        # Fundo e sprites do tema atual; cada tema é desenhado só na primeira vez que é usado
+        self._background, self._sprites = self._theme_assets(self.config.theme)
+    
+    @property
+    def background(self):
+        if self._background is None:
+            self.load_theme_assets()
+        return self._background
+    
+    @property
+    def sprites(self):
+        if self._sprites is None:
+            self.load_theme_assets()
+        return self._sprites
+    
+    def _theme_assets(self, name):
+        # (fundo, sprites) do tema, guardados por (tema, resolução, grid_size)
+        key = (name, self.config.screen_width, self.config.screen_height, self.config.grid_size)
+        return (self.assets.get(("background",) + key, lambda: self._create_background(name)),
+                self.assets.get(("sprites",) + key, lambda: self._create_sprites(name)))
+    
+    def prewarm_themes(self):
+        # Prepara numa thread de fundo os restantes temas, para que mudar de tema seja imediato
+        def prewarm():
+            for name in self.config.available_themes:
+                self._theme_assets(name)
+        thread = threading.Thread(target=prewarm, daemon=True)
+        thread.start()
+        return thread
+    
+    def draw_game(self, state, alpha=None):
+        # Desenha o estado do jogo (simulation.StateView); alpha (0-1) interpola entre o tick anterior e o atual.
+        # Devolve a lista de retângulos alterados (modo dirty_rects) ou None se o ecrã inteiro mudou.
+        time_remaining = state.time_remaining
+        if alpha is not None:
+            time_remaining = max(0, time_remaining - alpha / state.current_speed)   # Barra contínua entre ticks
         theme = self.themes[self.config.theme]
+        self._menu_ui = None   # O menu terá de ser redesenhado por inteiro
+        world_width, world_height = state.world_size
+        if (world_width, world_height) != (self.config.screen_width, self.config.screen_height):
+            return self._draw_game_camera(state, alpha, time_remaining, theme)
+        if self.config.dirty_rects:
+            return self._draw_game_dirty(state, alpha, time_remaining, theme)
         
-        # Desenha bombas (modo survival)
-        for bomb in bombs:
-            pygame.draw.rect(
-                self.screen, 
-                theme["bomb"], 
-                (bomb[0], bomb[1], self.config.grid_size, self.config.grid_size),
-                border_radius=10
-            )
-            # Pavio
-            pygame.draw.line(
-                self.screen, 
-                (255, 255, 0), 
-                (bomb[0] + self.config.grid_size//2, bomb[1] - 5),
-                (bomb[0] + self.config.grid_size//2, bomb[1] - 15),
-                3
-            )
+        self.screen.blit(self.background, (0, 0))   # Fundo
+        self.profiler.mark("draw.background")
+        self._draw_bombs(state.bombs)
+        self._draw_food(state.food)
         
-        # Desenha comida
-        center_x = food[0] + self.config.grid_size//2
-        center_y = food[1] + self.config.grid_size//2
-        pygame.draw.circle(
-            self.screen, 
-            theme["food"], 
-            (center_x, center_y), 
-            self.config.grid_size//2
-        )
-        # Brilho
-        pygame.draw.circle(
-            self.screen, 
-            (255, 255, 255, 100), 
-            (center_x - 3, center_y - 3), 
-            self.config.grid_size//4
-        )
-        
-        # Desenha cobra com gradiente
-        for i, segment in enumerate(snake):
-            # Gradiente da cabeça (verde escuro) para a cauda (verde)
-            color = self._gradient_color(
-                theme["head"],
-                theme["snake"],
-                i / max(1, len(snake))
-            )
-            pygame.draw.rect(
-                self.screen, 
-                color, 
-                (segment[0], segment[1], self.config.grid_size, self.config.grid_size),
-                border_radius=8
-            )
-            
-            # Brilho na cabeça
-            if i == 0:
-                pygame.draw.circle(
-                    self.screen, 
-                    (255, 255, 255, 180), 
-                    (segment[0] + self.config.grid_size//4, segment[1] + self.config.grid_size//4), 
-                    self.config.grid_size//6
-                )
+        # Desenha cobra com gradiente (sprites pré-desenhados, num único blits). Entre ticks o corpo
+        # fica nas células atuais e só a cabeça e a cauda deslizam, como nos modos incremental e câmara.
+        snake = state.snake
+        length = len(snake)
+        prev_tail = state.prev_tail
+        interpolate = prev_tail is not None and alpha is not None and alpha < 1.0
+        blits = [(self._segment_sprite(i, length), segment) for i, segment in enumerate(snake) if i or not interpolate]
+        if interpolate:
+            blits.append((self._segment_sprite(0, length), self._lerp(snake[1], snake[0], alpha)))
+            blits.append((self._segment_sprite(length - 1, length), self._lerp(prev_tail, snake[-1], alpha)))
+        self.screen.blits(blits, doreturn=False)
+        self.profiler.mark("draw.snake")
+        
+        self._draw_hud(state, time_remaining, theme)
+        self.profiler.mark("draw.hud")
+        
+        # Desenha partículas
+        self.particle_system.update()
+        self.particle_system.draw(self.screen)
+        self.profiler.mark("draw.particles")
+        self._full_redraw = True   # O modo incremental tem de recomeçar do zero
+        return None
+    
+    def _draw_game_dirty(self, state, alpha, time_remaining, theme):
+        # Modo incremental: só apaga e redesenha o que mudou desde o frame anterior.
+        # O corpo é estático entre ticks; cabeça e cauda interpoladas, comida, bombas, HUD e
+        # partículas são "transitórios", apagados e redesenhados a cada frame.
+        grid = self.config.grid_size
+        full = self._full_redraw
+        if full:
+            self.screen.blit(self.background, (0, 0))
+            self._static_cells = {}
+            self._static_key = None
+            self._transient_rects = []
+            self._full_redraw = False
+        dirty = []
+        
+        # Apaga os transitórios do frame anterior
+        for rect in self._transient_rects:
+            self.screen.blit(self.background, rect, rect)
+        dirty.extend(self._transient_rects)
+        self.profiler.mark("draw.background")
+        
+        # Corpo estático: só muda quando a simulação avança (version) ou a interpolação liga/desliga
+        snake = state.snake
+        length = len(snake)
+        prev_tail = state.prev_tail
+        interpolate = prev_tail is not None and alpha is not None and alpha < 1.0
+        cells = self._static_cells
+        key = (state.version, interpolate, length)
+        redraw = []
+        if key != self._static_key:
+            new_cells = {}
+            for i, segment in enumerate(snake):
+                if i == 0 and interpolate:
+                    continue   # A cabeça desliza como transitório
+                new_cells[segment] = self._segment_sprite(i, length)
+            for pos in cells:
+                if pos not in new_cells:
+                    rect = pygame.Rect(pos[0], pos[1], grid, grid)
+                    self.screen.blit(self.background, rect, rect)
+                    dirty.append(rect)
+            for pos, sprite in new_cells.items():
+                if cells.get(pos) is not sprite:
+                    rect = pygame.Rect(pos[0], pos[1], grid, grid)
+                    self.screen.blit(self.background, rect, rect)
+                    redraw.append((sprite, pos))
+            self._static_cells = cells = new_cells
+            self._static_key = key
+        
+        # Repõe segmentos estáticos parcialmente apagados pelos transitórios
+        for rect in self._transient_rects:
+            for y in range(rect.top // grid * grid, rect.bottom, grid):
+                for x in range(rect.left // grid * grid, rect.right, grid):
+                    sprite = cells.get((x, y))
+                    if sprite is not None:
+                        redraw.append((sprite, (x, y)))
+        dirty.extend(self.screen.blits(redraw))
+        
+        # Transitórios deste frame
+        transient = self._draw_bombs(state.bombs)
+        transient.append(self._draw_food(state.food))
+        if interpolate:
+            transient.extend(self.screen.blits([
+                (self._segment_sprite(0, length), self._lerp(snake[1], snake[0], alpha)),
+                (self._segment_sprite(length - 1, length), self._lerp(prev_tail, snake[-1], alpha))
+            ]))
+        self.profiler.mark("draw.snake")
+        transient.extend(self._draw_hud(state, time_remaining, theme))
+        self.profiler.mark("draw.hud")
+        self.particle_system.update()
+        transient.extend(self.particle_system.draw(self.screen))
+        self.profiler.mark("draw.particles")
+        dirty.extend(transient)
+        self._transient_rects = transient
+        return None if full else dirty
+    
+    def _draw_game_camera(self, state, alpha, time_remaining, theme):
+        # Mundo de tamanho diferente da janela: câmara centrada na cabeça e só o que está visível é desenhado.
+        # O custo depende do tamanho do ecrã, não do comprimento da cobra nem do tamanho do mundo.
+        grid = self.config.grid_size
+        screen_rect = self.screen.get_rect()
+        world_width, world_height = state.world_size
+        snake = state.snake
+        length = len(snake)
+        prev_tail = state.prev_tail
+        interpolate = prev_tail is not None and alpha is not None and alpha < 1.0
+        head = self._lerp(snake[1], snake[0], alpha) if interpolate else snake[0]
+        cam_x = self._camera_axis(head[0] + grid // 2, world_width, screen_rect.width)
+        cam_y = self._camera_axis(head[1] + grid // 2, world_height, screen_rect.height)
+        
+        # Fundo em blocos iguais (o padrão repete-se a cada 2 células); fora do mundo fica preto
+        view = pygame.Rect(-cam_x, -cam_y, world_width, world_height).clip(screen_rect)
+        if view != screen_rect:
+            self.screen.fill((0, 0, 0))
+        self.screen.set_clip(view)
+        chunk = self.assets.get(("chunk", self.config.theme, grid), lambda: self._create_background(
+            self.config.theme, self.CHUNK_CELLS * grid, self.CHUNK_CELLS * grid))
+        size = chunk.get_width()
+        left = view.left - (view.left + cam_x) % size
+        top = view.top - (view.top + cam_y) % size
+        self.screen.blits([
+            (chunk, (x, y)) for y in range(top, view.bottom, size) for x in range(left, view.right, size)
+        ], doreturn=False)
+        self.profiler.mark("draw.background")
+        
+        # Bombas e comida visíveis
+        visible = pygame.Rect(cam_x - grid, cam_y - grid, screen_rect.width + 2 * grid, screen_rect.height + 2 * grid)
+        self._draw_bombs([bomb for bomb in state.bombs if visible.collidepoint(bomb[0], bomb[1])], (cam_x, cam_y))
+        if state.food and visible.collidepoint(state.food):
+            self._draw_food(state.food, (cam_x, cam_y))
+        
+        # Segmentos nas células visíveis (com margem de uma célula para a cabeça e cauda interpoladas)
+        blits = [
+            (self._segment_sprite(i, length), (x - cam_x, y - cam_y))
+            for i, (x, y) in state.segments_in(visible.left, visible.top, visible.right, visible.bottom)
+            if i or not interpolate
+        ]
+        if interpolate:
+            for sprite, (x, y) in ((self._segment_sprite(0, length), head),
+                                   (self._segment_sprite(length - 1, length), self._lerp(prev_tail, snake[-1], alpha))):
+                blits.append((sprite, (x - cam_x, y - cam_y)))
+        self.screen.blits(blits, doreturn=False)
+        self.screen.set_clip(None)
+        self.profiler.mark("draw.snake")
+        
+        self._draw_hud(state, time_remaining, theme)
+        self.profiler.mark("draw.hud")
+        self.particle_system.update()
+        self.particle_system.draw(self.screen)
+        self.profiler.mark("draw.particles")
+        self._full_redraw = True   # A câmara move-se: o modo incremental tem de recomeçar do zero
+        return None
+    
+    def _camera_axis(self, target, world, view):
+        # Canto da câmara num eixo: centrado no alvo e preso às bordas (mundo menor = centrado)
+        if world <= view:
+            return (world - view) // 2
+        return int(min(max(0, target - view // 2), world - view))
+    
+    def invalidate(self):
+        # Força um redesenho completo no próximo draw_game/draw_menu (ex.: depois de outro ecrã)
+        self._full_redraw = True
+        self._menu_ui = None
+    
+    def _lerp(self, old, new, alpha):
+        # Posição interpolada entre duas células; sem interpolar ao atravessar uma parede
+        grid = self.config.grid_size
+        if abs(new[0] - old[0]) > grid or abs(new[1] - old[1]) > grid:
+            return new
+        return (old[0] + (new[0] - old[0]) * alpha, old[1] + (new[1] - old[1]) * alpha)
+    
+    def _create_sprites(self, name):
+        # Pré-desenha os sprites do tema: segmentos (tabela de gradiente quantizada),
+        # cabeça, comida e bomba. Feito uma vez por tema.
+        theme = self.themes[name]
+        grid = self.config.grid_size
         
-        # Desenha pontuação
-        score_text = self.fonts["score"].render(f"Pontuação: {score}", True, theme["ui"])
+        def segment(color, head=False):
+            surf = pygame.Surface((grid, grid), pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, (0, 0, grid, grid), border_radius=8)
+            if head:
+                # Brilho na cabeça
+                pygame.draw.circle(surf, (255, 255, 255), (grid//4, grid//4), grid//6)
+            return surf
+        
+        # Gradiente da cabeça (verde escuro) para a cauda (verde)
+        segments = [
+            segment(self._gradient_color(theme["head"], theme["snake"], step / self.GRADIENT_STEPS))
+            for step in range(self.GRADIENT_STEPS)
+        ]
+        
+        food = pygame.Surface((grid + 1, grid + 1), pygame.SRCALPHA)
+        pygame.draw.circle(food, theme["food"], (grid//2, grid//2), grid//2)
+        pygame.draw.circle(food, (255, 255, 255), (grid//2 - 3, grid//2 - 3), grid//4)   # Brilho
+        
+        # Bomba com o pavio por cima (o sprite começa 15 px acima da célula)
+        bomb = pygame.Surface((grid, grid + 15), pygame.SRCALPHA)
+        pygame.draw.rect(bomb, theme["bomb"], (0, 15, grid, grid), border_radius=10)
+        pygame.draw.line(bomb, (255, 255, 0), (grid//2, 10), (grid//2, 0), 3)   # Pavio
+        
+        return {
+            "segments": segments,
+            "head": segment(theme["head"], head=True),
+            "food": food,
+            "bomb": bomb
+        }
+    
+    def _segment_sprite(self, index, length):
+        # Sprite do segmento index: cabeça ou entrada da tabela de gradiente
+        if index == 0:
+            return self.sprites["head"]
+        return self.sprites["segments"][index * self.GRADIENT_STEPS // max(1, length)]
+    
+    def _draw_bombs(self, bombs, camera=(0, 0)):
+        # Desenha bombas (modo survival) e devolve os retângulos afetados
+        sprite = self.sprites["bomb"]
+        return self.screen.blits([(sprite, (bomb[0] - camera[0], bomb[1] - 15 - camera[1])) for bomb in bombs])
+    
+    def _draw_food(self, food, camera=(0, 0)):
+        # Desenha comida e devolve o retângulo afetado
+        return self.screen.blit(self.sprites["food"], (food[0] - camera[0], food[1] - camera[1]))
+    
+    def _draw_hud(self, state, time_remaining, theme):
+        # Desenha pontuação e UI do modo; devolve os retângulos afetados
+        rects = []
+        score_text = self.text.render_number(self.assets.font("score"), "Pontuação: ", state.score, theme["ui"])
         text_rect = score_text.get_rect(topleft=(20, 20))
         # Fundo escuro para legibilidade
-        pygame.draw.rect(
+        rects.append(pygame.draw.rect(
             self.screen, 
             (0, 0, 0, 150), 
             (text_rect.x - 10, text_rect.y - 5, text_rect.width + 20, text_rect.height + 10),
             border_radius=5
-        )
+        ))
         self.screen.blit(score_text, (20, 20))
         
         # Desenha UI específica do modo
-        if mode == "time_attack":
+        if state.mode == "time_attack":
             # Barra de tempo
             timer_width = 400
             timer_height = 20
@@ -178,48 +414,58 @@ class Renderer:
             timer_y = 20
             
             # Fundo da barra
-            pygame.draw.rect(self.screen, (100, 100, 100), (timer_x, timer_y, timer_width, timer_height), border_radius=10)
+            rects.append(pygame.draw.rect(self.screen, (100, 100, 100), (timer_x, timer_y, timer_width, timer_height), border_radius=10))
             
             # Preenchimento da barra (tempo restante)
-            if max_time > 0:
-                remaining_ratio = time_remaining / max_time
+            if state.max_time > 0:
+                remaining_ratio = time_remaining / state.max_time
                 remaining_width = max(0, int(timer_width * remaining_ratio))
                 pygame.draw.rect(self.screen, theme["accent"], (timer_x, timer_y, remaining_width, timer_height), border_radius=10)
             
             # Texto do tempo
-            time_text = self.fonts["score"].render(f"Tempo: {int(time_remaining)}s", True, theme["ui"])
-            self.screen.blit(time_text, (timer_x + timer_width + 10, timer_y))
+            time_text = self.text.render_number(self.assets.font("score"), "Tempo: ", int(time_remaining), theme["ui"], "s")
+            rects.append(self.screen.blit(time_text, (timer_x + timer_width + 10, timer_y)))
         
-        elif mode == "survival":
+        elif state.mode == "survival":
             # Desenha vidas (corações)
-            heart_text = self.fonts["score"].render("Vidas: ", True, theme["ui"])
-            self.screen.blit(heart_text, (self.config.screen_width - 150, 20))
-            for i in range(lives):
+            heart_text = self.text.render(self.assets.font("score"), "Vidas: ", theme["ui"])
+            rects.append(self.screen.blit(heart_text, (self.config.screen_width - 150, 20)))
+            for i in range(state.lives):
                 x = self.config.screen_width - 70 + i * 25
                 y = 30
                 # Dois círculos e um triângulo formando um coração
-                pygame.draw.circle(self.screen, (255, 0, 0), (x, y), 8)
-                pygame.draw.circle(self.screen, (255, 0, 0), (x+8, y), 8)
-                pygame.draw.polygon(self.screen, (255, 0, 0), [(x-4, y+4), (x+12, y+4), (x+4, y+12)])
-        
-        # Desenha partículas
-        self.particle_system.update()
-        self.particle_system.draw(self.screen)
+                rects.append(pygame.draw.circle(self.screen, (255, 0, 0), (x, y), 8))
+                rects.append(pygame.draw.circle(self.screen, (255, 0, 0), (x+8, y), 8))
+                rects.append(pygame.draw.polygon(self.screen, (255, 0, 0), [(x-4, y+4), (x+12, y+4), (x+4, y+12)]))
+        return rects
     
-    def draw_menu(self, menu_items, selected_index):
-        # Desenha o menu
-        self.check_theme_change()
+    def draw_menu(self, menu_items, selected_index, hit_index=None):
+        # Desenha o menu em modo retido: os widgets guardam as superfícies e só as áreas que mudaram
+        # (seleção, textos, partículas) são repintadas. Devolve os retângulos alterados, ou None se
+        # o ecrã inteiro foi redesenhado. hit_index (ui.HitIndex) recebe as áreas clicáveis dos itens.
+        self._full_redraw = True   # O ecrã de jogo terá de ser redesenhado por inteiro
         theme = self.themes[self.config.theme]
-        self.screen.fill(theme["bg"])
-        
-        # Limpa a lista de retângulos
-        self.menu_items_rects = []
+        full = self._menu_ui is None or len(self._menu_buttons) != len(menu_items)
+        if full:
+            self._build_menu(len(menu_items), theme, hit_index)
+        for i, (button, item) in enumerate(zip(self._menu_buttons, menu_items)):
+            # Cor diferente e destaque para o item selecionado
+            button.set_text(item, theme["accent"] if i == selected_index else theme["ui"])
+            button.set_selected(i == selected_index)
         
-        # Atualiza e desenha partículas
+        # Partículas: apaga a área antiga e desenha na nova (por baixo dos widgets)
+        old_particles = self._menu_particles
         self.particle_system.update()
-        self.particle_system.draw(self.screen)
+        self._menu_particles = self.particle_system.bounds(self.screen)
+        if full:
+            self._menu_ui.paint_all(self.screen, self.particle_system.draw)
+            dirty = None
+        else:
+            dirty = self._menu_ui.take_dirty() + old_particles + self._menu_particles
+            if dirty:
+                self._menu_ui.paint(self.screen, dirty, self.particle_system.draw)
         
-        # Adiciona partículas aleatórias
+        # Adiciona partículas aleatórias (aparecem no próximo frame)
         if random.random() > 0.9:
             self.particle_system.add_particles(
                 random.randint(0, self.config.screen_width),
@@ -227,141 +473,156 @@ class Renderer:
                 color=theme["accent"],
                 count=3
             )
-        
-        # Título
-        title = self.fonts["title"].render("SNAKE GAME", True, theme["accent"])
-        title_rect = title.get_rect(center=(self.config.screen_width//2, 150))
-        # Fundo escuro para o título
-        pygame.draw.rect(
-            self.screen, 
-            (0, 0, 0, 150), 
-            (title_rect.x - 20, title_rect.y - 15, title_rect.width + 40, title_rect.height + 30),
-            border_radius=15
-        )
-        self.screen.blit(title, title_rect)
-        
-        # Itens do menu
-        for i, item in enumerate(menu_items):
-            # Cor diferente para o item selecionado
-            color = theme["accent"] if i == selected_index else theme["ui"]
-            text = self.fonts["menu"].render(item, True, color)
-            text_rect = text.get_rect(center=(self.config.screen_width//2, 350 + i*70))
-            
-            # Define o retângulo para interação com o mouse
-            item_rect = pygame.Rect(
-                self.config.screen_width//2 - 200,
-                350 + i*70 - 25,
-                400,
-                50
+        return dirty
+    
+    def _build_menu(self, count, theme, hit_index):
+        # Cria os widgets do menu (título, itens e rodapé) para o tema atual
+        center_x = self.config.screen_width // 2
+        title = Label(self.text, self.assets.font("title"), "SNAKE GAME", theme["accent"], center=(center_x, 150))
+        self._menu_buttons = [
+            Button(
+                (center_x - 200, 350 + i*70 - 25, 400, 50),   # Área de clique do item
+                Label(self.text, self.assets.font("menu"), "", theme["ui"], center=(center_x, 350 + i*70)),
+                (0, 0, 0, 100)
             )
-            self.menu_items_rects.append(item_rect)
-            
-            # Destaca o item selecionado
-            if i == selected_index:
-                pygame.draw.rect(
-                    self.screen, 
-                    (0, 0, 0, 100), 
-                    item_rect,
-                    border_radius=10
-                )
-            
-            self.screen.blit(text, text_rect)
-        
-        # Rodapé com instruções
-        footer = self.fonts["score"].render("Usa as teclas de seta ou o rato para navegar • Pressiona ENTER para selecionar", True, theme["ui"])
-        self.screen.blit(footer, (self.config.screen_width//2 - footer.get_width()//2, self.config.screen_height - 50))
+            for i in range(count)
+        ]
+        footer = Label(self.text, self.assets.font("score"),
+                       "Usa as teclas de seta ou o rato para navegar • Pressiona ENTER para selecionar",
+                       theme["ui"], midtop=(center_x, self.config.screen_height - 50))
+        self._menu_ui = UILayer([
+            Panel(title.rect.inflate(40, 30), (0, 0, 0, 150), border_radius=15),   # Fundo escuro para o título
+            title,
+            *self._menu_buttons,
+            footer
+        ], theme["bg"])
+        self._menu_particles = []
+        if hit_index is not None:
+            hit_index.set((button.rect, i) for i, button in enumerate(self._menu_buttons))
     
     def draw_game_over(self, score, high_score, mode):
         # Tela de game over
-        self.check_theme_change()
+        self.invalidate()
         theme = self.themes[self.config.theme]
         self.screen.fill(theme["bg"])
         
         # Texto "Game Over"
-        game_over = self.fonts["game_over"].render("GAME OVER", True, (220, 20, 60))   # Vermelho
+        game_over = self.text.render(self.assets.font("game_over"), "GAME OVER", (220, 20, 60))   # Vermelho
         self.screen.blit(game_over, (self.config.screen_width//2 - game_over.get_width()//2, 200))
         
         # Modo
-        mode_text = self.fonts["menu"].render(f"Modo: {mode.replace('_', ' ').title()}", True, theme["ui"])
+        mode_text = self.text.render(self.assets.font("menu"), f"Modo: {mode.replace('_', ' ').title()}", theme["ui"])
         self.screen.blit(mode_text, (self.config.screen_width//2 - mode_text.get_width()//2, 270))
         
         # Pontuação
-        score_text = self.fonts["menu"].render(f"Pontuação: {score}", True, theme["ui"])
+        score_text = self.text.render_number(self.assets.font("menu"), "Pontuação: ", score, theme["ui"])
         self.screen.blit(score_text, (self.config.screen_width//2 - score_text.get_width()//2, 340))
         
         # Pontuação máxima
-        high_score_text = self.fonts["menu"].render(f"Pontuação Máxima: {high_score}", True, theme["accent"])
+        high_score_text = self.text.render_number(self.assets.font("menu"), "Pontuação Máxima: ", high_score, theme["accent"])
         self.screen.blit(high_score_text, (self.config.screen_width//2 - high_score_text.get_width()//2, 410))
         
         # Instrução
-        restart = self.fonts["menu"].render("Pressiona ENTER para continuar", True, theme["ui"])
+        restart = self.text.render(self.assets.font("menu"), "Pressiona ENTER para continuar", theme["ui"])
         self.screen.blit(restart, (self.config.screen_width//2 - restart.get_width()//2, 500))
         
         # Partículas
         self.particle_system.update()
         self.particle_system.draw(self.screen)
     
-    def draw_high_scores(self, scores):
-        # Tela de pontuações máximas
-        self.check_theme_change()
+    def draw_high_scores(self, scores, mode, page, pages, entries):
+        # Tela de pontuações: separadores por modo (com o recorde) e uma página do histórico.
+        # entries = lista de jogos da página, ou None enquanto a página está a ser carregada.
+        self.invalidate()
         theme = self.themes[self.config.theme]
+        center = self.config.screen_width // 2
         self.screen.fill(theme["bg"])
         
         # Título
-        title = self.fonts["title"].render("PONTUAÇÕES MÁXIMAS", True, theme["accent"])
-        self.screen.blit(title, (self.config.screen_width//2 - title.get_width()//2, 100))
+        title = self.text.render(self.assets.font("title"), "PONTUAÇÕES MÁXIMAS", theme["accent"])
+        self.screen.blit(title, (center - title.get_width()//2, 80))
         
-        # Cabeçalhos
-        header_font = pygame.font.SysFont("Arial", 36, bold=True)
-        mode_header = header_font.render("MODO", True, theme["ui"])
-        score_header = header_font.render("PONTUAÇÃO", True, theme["accent"])
+        # Separadores dos modos
+        for i, (tab_mode, best) in enumerate(scores.items()):
+            color = theme["accent"] if tab_mode == mode else theme["ui"]
+            tab = self.text.render_number(self.assets.font("score"), f"{tab_mode.replace('_', ' ').title()}: ", best, color)
+            x = center + (i - (len(scores) - 1) / 2) * 300
+            self.screen.blit(tab, (x - tab.get_width()//2, 180))
+            if tab_mode == mode:
+                pygame.draw.line(self.screen, theme["accent"], (x - tab.get_width()//2, 210), (x + tab.get_width()//2, 210), 2)
         
-        self.screen.blit(mode_header, (self.config.screen_width//2 - 200, 180))
-        self.screen.blit(score_header, (self.config.screen_width//2 + 100, 180))
+        # Cabeçalhos das colunas
+        font = self.assets.font("score")
+        columns = [center - 400, center - 300, center - 100, center + 100, center + 260]   # x de cada coluna
+        for x, header in zip(columns, ("#", "PONTUAÇÃO", "DIFICULDADE", "TAMANHO", "DURAÇÃO")):
+            self.screen.blit(self.text.render(font, header, theme["accent"]), (x, 250))
         
         # Divisor
-        pygame.draw.line(
-            self.screen, 
-            theme["ui"], 
-            (self.config.screen_width//2 - 200, 220),
-            (self.config.screen_width//2 + 200, 220),
-            2
-        )
-        
-        # Lista de pontuações
-        y_pos = 240
-        for mode, score in scores.items():
-            mode_text = self.fonts["menu"].render(f"{mode.replace('_', ' ').title()}", True, theme["ui"])
-            score_text = self.fonts["menu"].render(f"{score}", True, theme["accent"])
-            
-            self.screen.blit(mode_text, (self.config.screen_width//2 - 180, y_pos))
-            self.screen.blit(score_text, (self.config.screen_width//2 + 120, y_pos))
-            y_pos += 60
+        pygame.draw.line(self.screen, theme["ui"], (center - 420, 285), (center + 420, 285), 2)
+        
+        # Jogos da página
+        if not entries:
+            message = "A carregar..." if entries is None else "Ainda não há jogos neste modo"
+            text = self.text.render(font, message, theme["ui"])
+            self.screen.blit(text, (center - text.get_width()//2, 310))
+        else:
+            y_pos = 300
+            for entry in entries:
+                duration = int(entry["duration"])
+                cells = (
+                    self.text.render_number(font, "", entry["rank"], theme["ui"]),
+                    self.text.render_number(font, "", entry["score"], theme["accent"]),
+                    self.text.render(font, (entry["difficulty"] or "-").title(), theme["ui"]),
+                    self.text.render_number(font, "", entry["length"], theme["ui"]),
+                    self.text.render(font, f"{duration // 60}:{duration % 60:02d}", theme["ui"])
+                )
+                self.screen.blits(list(zip(cells, ((x, y_pos) for x in columns))), doreturn=False)
+                y_pos += 36
         
-        # Rodapé
-        footer = self.fonts["score"].render("Pressiona ENTER para voltar ao menu", True, theme["ui"])
-        self.screen.blit(footer, (self.config.screen_width//2 - footer.get_width()//2, self.config.screen_height - 100))
+        # Página e rodapé
+        page_text = self.text.render(font, f"Página {page + 1}/{pages}", theme["ui"])
+        self.screen.blit(page_text, (center - page_text.get_width()//2, self.config.screen_height - 140))
+        footer = self.text.render(font, "ESQ/DIR: modo   CIMA/BAIXO: página   ENTER: voltar ao menu", theme["ui"])
+        self.screen.blit(footer, (center - footer.get_width()//2, self.config.screen_height - 100))
     
     def draw_waiting_for_respawn(self, lives):
         # Tela de espera por renascimento (modo survival)
+        self.invalidate()
         theme = self.themes[self.config.theme]
         
         # Overlay escuro
-        overlay = pygame.Surface((self.config.screen_width, self.config.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        overlay = self.assets.overlay((self.config.screen_width, self.config.screen_height), (0, 0, 0, 150))
         self.screen.blit(overlay, (0, 0))
         
         # Mensagem
-        font = pygame.font.SysFont("Arial", 48, bold=True)
-        text = font.render("Pressiona qualquer tecla para renascer", True, theme["accent"])
+        font = self.assets.font("message")
+        text = self.text.render(font, "Pressiona qualquer tecla para renascer", theme["accent"])
         self.screen.blit(text, (self.config.screen_width//2 - text.get_width()//2, 
                               self.config.screen_height//2 - text.get_height()//2))
         
         # Vidas restantes
-        lives_text = font.render(f"Vidas: {lives}", True, theme["ui"])
+        lives_text = self.text.render_number(font, "Vidas: ", lives, theme["ui"])
         self.screen.blit(lives_text, (self.config.screen_width//2 - lives_text.get_width()//2, 
                                      self.config.screen_height//2 + 50))
     
+    def draw_profiler(self):
+        # Tabela de percentis do perfil no canto inferior esquerdo; devolve o retângulo desenhado.
+        # Nos ecrãs incrementais a área é apagada no frame seguinte, como as partículas.
+        font = self.assets.font("debug")
+        lines = [self.text.render(font, line, (255, 255, 255)) for line in self.profiler.report()]
+        if not lines:
+            return None
+        height = font.get_linesize()
+        rect = pygame.Rect(0, 0, max(line.get_width() for line in lines) + 20, height * len(lines) + 10)
+        rect.bottomleft = (10, self.config.screen_height - 10)
+        self.screen.blit(self.assets.overlay(rect.size, (0, 0, 0, 180)), rect)
+        self.screen.blits([(line, (rect.x + 10, rect.y + 5 + i * height)) for i, line in enumerate(lines)], doreturn=False)
+        if self._menu_ui is not None:
+            self._menu_particles.append(rect)
+        elif not self._full_redraw:
+            self._transient_rects.append(rect)
+        return rect
+    
     def _gradient_color(self, start, end, progress):
         # Calcula uma cor intermediária no gradiente
         return (
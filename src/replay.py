@@ -0,0 +1,176 @@
+# Este código foi feito por Azam Usman
+import json
+import struct
+import sys
+import time
+import zlib
+from config import Config
+from simulation import Simulation, UP, RIGHT, DOWN, LEFT
+
+# Formato binário de replay (little-endian):
+#   "SNKR" | versão u8 | modo u8 | semente u64 | tamanho u16 + JSON da configuração
+#   nº de eventos (varint) | eventos: varint(delta_ticks << 2 | direção)
+#   ticks finais (varint) | pontuação final (varint) | checksum do estado final u32
+MAGIC = b"SNKR"
+VERSION = 1
+MODES = ("classic", "time_attack", "survival")
+DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
+CONFIG_FIELDS = ("screen_width", "screen_height", "grid_size", "world_cols", "world_rows",
+                 "difficulty", "base_speed", "speed_increment", "max_speed")
+TUNABLE_FIELDS = ("min_time", "max_time", "bomb_lifetime",
+                  "bomb_interval_start", "bomb_interval_min", "bomb_interval_foods")
+
+def state_checksum(sim):
+    # CRC32 do estado relevante (cobra, comida, bombas, pontuação, vidas)
+    state = (tuple(sim.snake), sim.food, tuple((b[0], b[1]) for b in sim.bombs), sim.score, sim.lives)
+    return zlib.crc32(repr(state).encode())
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+class Replay:
+    # Semente, configuração e mudanças de direção (tick, direção) de um jogo
+    def __init__(self, mode, seed, config, events=None, ticks=0, score=0, checksum=0):
+        self.mode = mode
+        self.seed = seed
+        self.config = config   # Dicionário com CONFIG_FIELDS e TUNABLE_FIELDS
+        self.events = events if events is not None else []
+        self.ticks = ticks   # Ticks jogados
+        self.score = score   # Pontuação final esperada
+        self.checksum = checksum   # Checksum do estado final esperado
+
+    def to_bytes(self):
+        out = bytearray(MAGIC)
+        blob = json.dumps(self.config, separators=(",", ":")).encode()
+        out += struct.pack("<BBQH", VERSION, MODES.index(self.mode), self.seed, len(blob))
+        out += blob
+        _write_varint(out, len(self.events))
+        last = 0
+        for tick, direction in self.events:
+            _write_varint(out, ((tick - last) << 2) | DIRECTIONS.index(direction))
+            last = tick
+        _write_varint(out, self.ticks)
+        _write_varint(out, self.score)
+        out += struct.pack("<I", self.checksum)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != MAGIC:
+            raise ValueError("Não é um ficheiro de replay")
+        version, mode, seed, size = struct.unpack_from("<BBQH", data, 4)
+        if version != VERSION:
+            raise ValueError(f"Versão de replay não suportada: {version}")
+        pos = 4 + struct.calcsize("<BBQH")
+        config = json.loads(data[pos:pos + size])
+        pos += size
+        count, pos = _read_varint(data, pos)
+        events, tick = [], 0
+        for _ in range(count):
+            value, pos = _read_varint(data, pos)
+            tick += value >> 2
+            events.append((tick, DIRECTIONS[value & 3]))
+        ticks, pos = _read_varint(data, pos)
+        score, pos = _read_varint(data, pos)
+        checksum, = struct.unpack_from("<I", data, pos)
+        return cls(MODES[mode], seed, config, events, ticks, score, checksum)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+class ReplayRecorder:
+    # Liga-se a uma Simulation acabada de reiniciar e regista as mudanças de direção
+    def __init__(self, sim):
+        self.sim = sim
+        config = {name: getattr(sim.config, name) for name in CONFIG_FIELDS}
+        config.update({name: getattr(sim, name) for name in TUNABLE_FIELDS})
+        self.replay = Replay(sim.mode, sim.seed, config)
+        sim.recorder = self
+
+    def record(self, tick, direction):
+        # Chamado pela simulação quando uma nova direção é aplicada
+        self.replay.events.append((tick, direction))
+
+    def finish(self):
+        # Fecha o replay com o resultado atual da simulação
+        self.replay.ticks = self.sim.ticks
+        self.replay.score = self.sim.score
+        self.replay.checksum = state_checksum(self.sim)
+        return self.replay
+
+def _advance(sim, n):
+    # Avança n ticks, renascendo automaticamente no modo survival
+    while n > 0 and not sim.game_over:
+        if sim.waiting_for_respawn:
+            sim.trigger_respawn()
+        n -= sim.step(n)
+
+def make_simulation(replay, config=None):
+    # Simulation reiniciada com a semente, a configuração e as afinações gravadas no replay
+    config = config if config is not None else Config(load=False)
+    for name in CONFIG_FIELDS:
+        if name in replay.config:   # Replays antigos não têm world_cols/world_rows
+            setattr(config, name, replay.config[name])
+    sim = Simulation(config, replay.mode, seed=replay.seed)
+    for name in TUNABLE_FIELDS:
+        setattr(sim, name, replay.config[name])
+    return sim
+
+def iter_ticks(replay, sim):
+    # Avança sim (de make_simulation) um tick por iteração, renascendo automaticamente
+    events = iter(replay.events)
+    event = next(events, None)
+    while sim.ticks < replay.ticks and not sim.game_over:
+        if sim.waiting_for_respawn:
+            sim.trigger_respawn()
+        while event is not None and event[0] == sim.ticks + 1:
+            sim.next_direction = event[1]
+            event = next(events, None)
+        sim.step(1)
+        yield sim
+
+def play_replay(replay):
+    # Reproduz um replay sem ecrã e à velocidade máxima; devolve a simulação final
+    sim = make_simulation(replay)
+    for tick, direction in replay.events:
+        _advance(sim, tick - 1 - sim.ticks)
+        sim.next_direction = direction
+    _advance(sim, replay.ticks - sim.ticks)
+    return sim
+
+def verify(replay):
+    # True se o replay reproduz exatamente o resultado gravado
+    sim = play_replay(replay)
+    return (sim.ticks == replay.ticks and sim.score == replay.score and
+            state_checksum(sim) == replay.checksum)
+
+if __name__ == "__main__":
+    # Uso: python src/replay.py ficheiro.snkr [...] (verifica o corpus de regressão)
+    failures = 0
+    for path in sys.argv[1:]:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        ok = verify(replay)
+        elapsed = (time.perf_counter() - start) * 1000
+        failures += not ok
+        print(f"{'OK ' if ok else 'FALHOU'} {path}: {replay.ticks} ticks, {replay.score} pontos, {elapsed:.1f} ms")
+    sys.exit(1 if failures else 0)
\ No newline at end of file
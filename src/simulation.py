@@ -0,0 +1,508 @@
+# Este código foi feito por Azam Usman
+import heapq
+import math
+import random
+from array import array
+from collections import deque
+
+# Direções abstratas (independentes do pygame)
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+_IOTA = array("i")   # 0, 1, 2, ... (cresce quando preciso); fatias copiadas com memcpy em _build_free_index
+
+def _iota(n):
+    # Array com pelo menos os primeiros n inteiros consecutivos
+    global _IOTA
+    if len(_IOTA) < n:
+        _IOTA = array("i", range(n))
+    return _IOTA
+
+class TickClock:
+    # Relógio simulado: só avança quando a simulação avança (sem time.time())
+    def __init__(self, start=0.0):
+        self.now = start   # Tempo simulado em segundos
+
+    def advance(self, dt):
+        # Avança o relógio dt segundos
+        self.now += dt
+        return self.now
+
+class StateView:
+    # Vista só de leitura e sem alocações sobre o estado de uma Simulation.
+    # version muda apenas quando a simulação avança (tick, reinício ou renascimento),
+    # para que renderer, HUD e gravadores possam saltar trabalho quando nada mudou.
+    __slots__ = ("_sim",)
+
+    def __init__(self, sim):
+        object.__setattr__(self, "_sim", sim)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("StateView é só de leitura")
+
+    @property
+    def version(self):
+        return self._sim.version
+
+    @property
+    def snake(self):
+        return self._sim.body
+
+    @property
+    def food(self):
+        return self._sim.food
+
+    @property
+    def bombs(self):
+        # (x, y, tempo_de_nascimento) por bomba
+        return self._sim.bomb_cells.values()
+
+    @property
+    def score(self):
+        return self._sim.score
+
+    @property
+    def game_over(self):
+        return self._sim.game_over
+
+    @property
+    def mode(self):
+        return self._sim.mode
+
+    @property
+    def time_remaining(self):
+        return self._sim.time_remaining if self._sim.mode == "time_attack" else 0
+
+    @property
+    def max_time(self):
+        return self._sim.max_time if self._sim.mode == "time_attack" else 0
+
+    @property
+    def lives(self):
+        return self._sim.lives if self._sim.mode == "survival" else 0
+
+    @property
+    def waiting_for_respawn(self):
+        return self._sim.waiting_for_respawn
+
+    @property
+    def current_speed(self):
+        return self._sim.current_speed
+
+    @property
+    def prev_tail(self):
+        return self._sim.prev_tail
+
+    @property
+    def world_size(self):
+        # Tamanho do mundo em pixels (pode ser maior do que a janela)
+        return self._sim.width, self._sim.height
+
+    def segments_in(self, left, top, right, bottom):
+        return self._sim.segments_in(left, top, right, bottom)
+
+class Simulation:
+    # Motor do jogo puro: sem pygame, sem ecrã e sem acesso ao disco
+    MAX_TURNS = 3   # Viragens em espera (teclas além disto são ignoradas)
+    def __init__(self, config, mode="classic", clock=None, seed=None):
+        self.config = config   # Qualquer objeto com os campos de Config
+        self.clock = clock if clock is not None else TickClock()   # Relógio injetável
+        self.version = 0   # Muda sempre que o estado visível muda
+        self.view = StateView(self)   # Vista única reutilizada em todos os frames
+        self.reset(mode, seed)
+
+    def reset(self, mode, seed=None):
+        # Reinicia o jogo com o modo especificado; cada jogo tem a sua semente e o seu gerador
+        self.mode = mode
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        self.clock.now = 0.0   # O relógio simulado recomeça a cada jogo
+        self.recorder = None   # Gravador de replay (ver replay.ReplayRecorder)
+        self.version += 1
+        self.grid = self.config.grid_size
+        # Mundo: do tamanho da janela, ou world_cols x world_rows células (independente do ecrã)
+        self.width = self.config.world_cols * self.grid if self.config.world_cols else self.config.screen_width
+        self.height = self.config.world_rows * self.grid if self.config.world_rows else self.config.screen_height
+        self.cols = self.width // self.grid   # Colunas da grade
+        self.rows = self.height // self.grid   # Linhas da grade
+        self.food = None   # Comida atual (x, y)
+        self.bomb_cells = {}   # Bombas por célula: célula -> (x, y, tempo_de_nascimento)
+        self.bomb_heap = []   # Min-heap (tempo_de_nascimento, célula) para expirar bombas
+        # Inicializa a cobra no centro da tela
+        self._place_snake()
+        self.prev_tail = None   # Cauda antes do último movimento (None = sem interpolação)
+        self._build_free_index()
+        self.direction = RIGHT   # Direção inicial (direita)
+        self.next_direction = RIGHT   # Próxima direção (para suavizar entrada)
+        self.turns = deque()   # Viragens pedidas e ainda não aplicadas: (direção, instante da tecla)
+        self.turn_time = None   # Instante da tecla da viragem aplicada no último tick (None = nenhuma)
+        self.score = 0   # Pontuação
+        self.food = self._spawn_food()   # Gera a primeira comida
+        self.game_over = False   # Estado do jogo
+        self.ticks = 0   # Número de movimentos simulados
+
+        # Dificuldade progressiva
+        self.base_speed = self.config.base_speed[self.config.difficulty]   # Velocidade base
+        self.current_speed = self.base_speed   # Velocidade atual
+        self.foods_eaten = 0   # Contador de comidas comidas
+
+        # Modo Time Attack - tempo dinâmico
+        self.time_remaining = 20.0   # Tempo inicial para a primeira comida
+        self.max_time = 60.0   # Tempo máximo possível para qualquer comida
+        self.min_time = 5.0    # Tempo mínimo para qualquer comida
+        self.time_set = False  # Flag para indicar se o tempo foi definido para a comida atual
+
+        # Modo Survival (sobrevivência)
+        self.lives = 3   # Vidas
+        self.bomb_lifetime = 10   # Tempo de vida da bomba em segundos
+        self.bomb_spawn_timer = 0   # Temporizador para gerar bombas
+        self.bomb_interval_start = 6   # Intervalo inicial entre bombas (s)
+        self.bomb_interval_min = 2   # Intervalo mínimo entre bombas (s)
+        self.bomb_interval_foods = 10   # Comidas para reduzir o intervalo em 1 s
+        self.waiting_for_respawn = False   # Estado de espera por renascimento
+
+    def _place_snake(self):
+        # Três segmentos no centro, virados para a direita
+        cx, cy = self.width // 2, self.height // 2
+        shape = (self.cols, self.rows, self.grid)
+        if getattr(self, "grid_shape", None) == shape:
+            # Mesmo mundo e mesma grade: reutiliza as grades e só apaga a cobra antiga
+            # (entered só conta nas células ocupadas)
+            for x, y in self.body:
+                self.occupied[self._cell(x, y)] = 0
+        else:
+            self.occupied = bytearray(self.cols * self.rows)   # 1 = célula ocupada pela cobra
+            self.entered = array("i", [0]) * (self.cols * self.rows)   # Movimento em que a cabeça entrou na célula
+            self.grid_shape = shape   # (colunas, linhas, grade) das grades alocadas
+        self.body = deque([(cx, cy), (cx - self.grid, cy), (cx - 2 * self.grid, cy)])   # Cabeça à esquerda
+        self.head_tick = 0   # Movimentos da cabeça: body[i] é a célula onde a cabeça estava há i movimentos
+        for i, (x, y) in enumerate(self.body):
+            self.occupied[self._cell(x, y)] = 1
+            self.entered[self._cell(x, y)] = -i
+
+    def _cell(self, x, y):
+        # Índice linear da célula que contém o pixel (x, y)
+        return (y // self.grid) * self.cols + x // self.grid
+
+    def _cell_pos(self, cell):
+        # Pixel do canto superior esquerdo de uma célula
+        return ((cell % self.cols) * self.grid, (cell // self.cols) * self.grid)
+
+    def segments_in(self, left, top, right, bottom):
+        # Segmentos (índice, posição) dentro do retângulo de pixels [left, right) x [top, bottom):
+        # percorre só as células do retângulo, não a cobra inteira
+        grid = self.grid
+        col_start, col_end = max(0, left // grid), min(self.cols, -(-right // grid))
+        occupied, entered, head_tick = self.occupied, self.entered, self.head_tick
+        for row in range(max(0, top // grid), min(self.rows, -(-bottom // grid))):
+            base = row * self.cols
+            end = base + col_end
+            cell = occupied.find(1, base + col_start, end)
+            while cell >= 0:
+                yield head_tick - entered[cell], ((cell - base) * grid, row * grid)
+                cell = occupied.find(1, cell + 1, end)
+
+    def _build_free_index(self):
+        # Índice exato das células livres (sem cobra, comida ou bomba):
+        # free é um array com remoção por troca e free_pos mapeia célula -> posição (-1 = ocupada)
+        # Construído por intervalos entre as células bloqueadas, copiados de _iota (memcpy), em array("i").
+        # A ordem (crescente) é sempre a mesma: as posições sorteadas para comida e bombas, e
+        # portanto os replays, dependem dela.
+        n = self.cols * self.rows
+        blocked = {self._cell(x, y) for x, y in self.body}
+        if self.food:
+            blocked.add(self._cell(*self.food))
+        blocked.update(self.bomb_cells)
+        iota = _iota(n)
+        self.free = free = array("i")
+        self.free_pos = free_pos = array("i")
+        start = 0
+        for k, cell in enumerate(sorted(blocked)):
+            free.extend(iota[start:cell])
+            free_pos.extend(iota[start - k:cell - k])
+            free_pos.append(-1)
+            start = cell + 1
+        free.extend(iota[start:n])
+        free_pos.extend(iota[start - len(blocked):n - len(blocked)])
+
+    def _take_cell(self, cell):
+        # Marca a célula como ocupada em O(1) (troca com o último e remove)
+        pos = self.free_pos[cell]
+        if pos < 0:
+            return
+        last = self.free.pop()
+        if last != cell:
+            self.free[pos] = last
+            self.free_pos[last] = pos
+        self.free_pos[cell] = -1
+
+    def _release_cell(self, cell):
+        # Devolve a célula ao índice de livres (exceto se a cobra estiver nela)
+        if self.free_pos[cell] < 0 and not self.occupied[cell]:
+            self.free_pos[cell] = len(self.free)
+            self.free.append(cell)
+
+    @property
+    def snake(self):
+        # Vista só de leitura dos segmentos (cabeça primeiro), usada pelo Renderer
+        return self.body
+
+    @property
+    def bombs(self):
+        # Vista só de leitura das bombas (x, y, tempo_de_nascimento), por ordem de criação
+        return self.bomb_cells.values()
+
+    def _random_free_cell(self):
+        # Amostragem uniforme O(1) entre as células livres; None se o tabuleiro estiver cheio
+        if not self.free:
+            return None
+        return self.free[self.rng.randrange(len(self.free))]
+
+    def _free_cell_near(self, pos, radius=3):
+        # Célula livre uniforme na janela (2*radius+1)^2 à volta de pos; None se não houver
+        col, row = pos[0] // self.grid, pos[1] // self.grid
+        candidates = [
+            r * self.cols + c
+            for r in range(max(0, row - radius), min(self.rows, row + radius + 1))
+            for c in range(max(0, col - radius), min(self.cols, col + radius + 1))
+            if self.free_pos[r * self.cols + c] >= 0
+        ]
+        if not candidates:
+            return None
+        return candidates[self.rng.randrange(len(candidates))]
+
+    def _spawn_food(self, away_from_snake=False):
+        # Gera comida numa célula livre (sempre válida) e reserva-a
+        cell = self._random_free_cell()
+        if cell is None:
+            return None   # Tabuleiro cheio
+        self._take_cell(cell)
+        return self._cell_pos(cell)
+
+    def _spawn_bomb(self):
+        # Gera uma bomba numa célula livre (não na cobra, comida ou outra bomba) e reserva-a
+        cell = None
+        # 70% de chance de colocar a bomba perto da comida, 30% aleatório
+        if self.rng.random() < 0.7 and self.food:
+            cell = self._free_cell_near(self.food)
+        if cell is None:
+            cell = self._random_free_cell()
+        if cell is None:
+            return None   # Retorna None se não houver espaço
+        self._take_cell(cell)
+        bomb = (*self._cell_pos(cell), self.clock.now)   # Com o tempo simulado atual
+        self.bomb_cells[cell] = bomb
+        heapq.heappush(self.bomb_heap, (bomb[2], cell))
+        return bomb
+
+    def set_direction(self, direction, timestamp=None):
+        # Entrada abstrata: põe a viragem na fila, aplicada uma por tick (duas teclas rápidas
+        # no mesmo tick já não se perdem). A inversão é verificada contra a última direção
+        # pendente, não a atual, para a cobra nunca voltar para dentro de si.
+        # timestamp: instante da tecla (opaco para a simulação; serve para medir a latência)
+        if direction not in OPPOSITE:
+            return False
+        last = self.turns[-1][0] if self.turns else self.next_direction
+        if direction == last:
+            return True   # Já vai nessa direção
+        if direction == OPPOSITE[last] or len(self.turns) >= self.MAX_TURNS:
+            return False
+        self.turns.append((direction, timestamp))
+        return True
+
+    def tick(self):
+        # Um movimento da cobra; cada tick dura 1/velocidade segundos simulados
+        self.update(1.0 / self.current_speed)
+
+    def step(self, n=1):
+        # Avança até n ticks; para mais cedo em game over ou espera por renascimento
+        done = 0
+        while done < n and not (self.game_over or self.waiting_for_respawn):
+            self.update(1.0 / self.current_speed)
+            done += 1
+        return done   # Número de ticks efetivamente simulados
+
+    def update(self, dt):
+        # Atualiza o estado do jogo
+        if self.game_over or self.waiting_for_respawn:
+            return
+
+        self.clock.advance(dt)
+        self.ticks += 1
+        self.version += 1
+
+        # Atualiza o tempo no modo Time Attack
+        if self.mode == "time_attack":
+            # Define o tempo apenas uma vez por comida
+            if not self.time_set:
+                # Calcula a distância até a comida para alocar tempo inteligente
+                head_x, head_y = self.snake[0]
+                distance = math.sqrt((self.food[0] - head_x)**2 + (self.food[1] - head_y)**2)
+
+                # Normaliza a distância (0-1) baseado na diagonal da tela
+                max_distance = math.sqrt(self.width**2 + self.height**2)
+                normalized_distance = distance / max_distance
+
+                # Escala o tempo baseado na distância (comida mais perto = menos tempo)
+                # Usa escala quadrática para diferenças mais dramáticas
+                self.time_remaining = self.min_time + (self.max_time - self.min_time) * (1 - normalized_distance**2)
+                self.time_set = True
+
+                # Ajusta baseado no tamanho da cobra (cobra maior = menos tempo)
+                size_factor = len(self.snake) / 50
+                self.time_remaining *= max(0.5, 1.0 - size_factor)
+
+            # Diminui o tempo normalmente
+            self.time_remaining -= dt
+
+            if self.time_remaining <= 0:
+                self.game_over = True
+                return
+
+        # Atualiza bombas (modo survival)
+        if self.mode == "survival":
+            # Remove bombas expiradas (as mais antigas estão no topo do heap)
+            current_time = self.clock.now
+            heap = self.bomb_heap
+            while heap and current_time - heap[0][0] >= self.bomb_lifetime:
+                birth, cell = heapq.heappop(heap)
+                bomb = self.bomb_cells.get(cell)
+                if bomb is not None and bomb[2] == birth:   # Ignora entradas de bombas já removidas
+                    del self.bomb_cells[cell]
+                    self._release_cell(cell)
+
+            # Gera novas bombas
+            self.bomb_spawn_timer += dt
+            # Gera bombas mais frequentemente conforme o jogo progride
+            if self.bomb_spawn_timer > max(self.bomb_interval_min,
+                                           self.bomb_interval_start - (self.foods_eaten / self.bomb_interval_foods)):
+                self._spawn_bomb()
+                self.bomb_spawn_timer = 0
+
+        # Uma viragem da fila por tick (o replay grava a direção no tick em que é aplicada)
+        self.turn_time = None
+        if self.turns:
+            self.next_direction, self.turn_time = self.turns.popleft()
+
+        if self.recorder is not None and self.next_direction != self.direction:
+            self.recorder.record(self.ticks, self.next_direction)   # Só as mudanças de direção
+        self.direction = self.next_direction   # Atualiza a direção
+
+        # Move a cobra
+        body = self.body
+        head_x = body[0][0] + self.direction[0] * self.grid
+        head_y = body[0][1] + self.direction[1] * self.grid
+
+        # Colisão com paredes baseada no modo
+        if self.mode != "survival":
+            # Teletransporta a cobra pelas paredes
+            if head_x < 0:
+                head_x = self.width - self.grid
+            elif head_x >= self.width:
+                head_x = 0
+            if head_y < 0:
+                head_y = self.height - self.grid
+            elif head_y >= self.height:
+                head_y = 0
+        elif head_x < 0 or head_x >= self.width or head_y < 0 or head_y >= self.height:
+            # Modo survival: paredes sólidas
+            self.handle_collision()   # Trata colisão
+            return
+        new_head = (head_x, head_y)
+        head_cell = (head_y // self.grid) * self.cols + head_x // self.grid
+
+        # Colisão consigo mesma (a cauda ainda conta, como antes)
+        if self.occupied[head_cell]:
+            self.handle_collision()
+            return
+
+        # Colisão com bomba (apenas survival)
+        if self.mode == "survival" and head_cell in self.bomb_cells:
+            self.handle_collision()
+            # Remove a bomba (a entrada no heap é ignorada quando expirar)
+            self.bomb_cells.pop(head_cell, None)
+            self._release_cell(head_cell)
+            return
+
+        body.appendleft(new_head)   # Adiciona nova cabeça
+        self.occupied[head_cell] = 1
+        self.head_tick += 1
+        self.entered[head_cell] = self.head_tick
+        self._take_cell(head_cell)
+
+        # Colisão com comida
+        if new_head == self.food:
+            self.score += 10
+            self.foods_eaten += 1
+
+            # Dificuldade progressiva - aumenta a velocidade
+            self.current_speed = min(
+                self.base_speed + (self.foods_eaten * self.config.speed_increment),
+                self.config.max_speed
+            )
+
+            # Gera nova comida; sem células livres a cobra encheu o tabuleiro
+            self.prev_tail = body[-1]   # Cresceu: a cauda fica no mesmo sítio
+            self.food = self._spawn_food()
+            if self.food is None:
+                self.game_over = True
+                return
+
+            # Reseta a flag de tempo para nova comida (time attack)
+            if self.mode == "time_attack":
+                self.time_set = False
+        else:
+            tail_x, tail_y = self.prev_tail = body.pop()   # Remove a cauda se não comeu
+            tail_cell = (tail_y // self.grid) * self.cols + tail_x // self.grid
+            self.occupied[tail_cell] = 0
+            self._release_cell(tail_cell)
+
+    def handle_collision(self):
+        # Trata colisões (paredes, si mesma, bombas)
+        if self.mode == "survival":
+            self.lives -= 1
+            if self.lives <= 0:
+                self.game_over = True
+            else:
+                self.waiting_for_respawn = True
+                # Reseta a posição da cobra; bombas sob ela desaparecem e a comida muda de sítio
+                self._place_snake()
+                self.prev_tail = None
+                for cell in [c for c in self.bomb_cells if self.occupied[c]]:
+                    del self.bomb_cells[cell]
+                if self.food and self.occupied[self._cell(*self.food)]:
+                    self.food = None
+                self._build_free_index()
+                if self.food is None:
+                    self.food = self._spawn_food()
+                self.direction = RIGHT
+                self.next_direction = RIGHT
+                self.turns.clear()
+        else:
+            self.game_over = True   # Fim de jogo em outros modos
+
+    def trigger_respawn(self):
+        # Reinicia o jogo após colisão no modo survival (quando tem vidas)
+        if self.waiting_for_respawn:
+            self.waiting_for_respawn = False
+            self.version += 1
+
+    def get_state(self):
+        # Retorna o estado atual do jogo para renderização
+        return {
+            "snake": self.snake,
+            "food": self.food,
+            "bombs": [(b[0], b[1]) for b in self.bombs],  # Apenas posições
+            "score": self.score,
+            "game_over": self.game_over,
+            "mode": self.mode,
+            "time_remaining": self.time_remaining if self.mode == "time_attack" else 0,
+            "max_time": self.max_time if self.mode == "time_attack" else 0,
+            "lives": self.lives if self.mode == "survival" else 0,
+            "waiting_for_respawn": self.waiting_for_respawn,
+            "current_speed": self.current_speed,
+            "prev_tail": self.prev_tail
+        }
\ No newline at end of file
@@ -0,0 +1,79 @@
+# Este código foi feito por Azam Usman
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Mede o arranque a frio do jogo: cada execução é um processo novo (main.py --exit-after-first-frame).
+# Os resultados são acrescentados a um histórico JSONL para comparar versões.
+# Exemplo: python src/startup_bench.py --runs 7 --label 1.1.0
+#          python src/startup_bench.py --command dist/UltimateSnakeGame/UltimateSnakeGame
+
+METRICS = ("imports_ms", "first_frame_ms", "process_ms")   # Imports do main.py, 1º frame, processo inteiro
+
+def run_once(command, env):
+    # Uma execução: tempos escritos pelo jogo e duração total do processo (inclui o interpretador)
+    start = time.perf_counter()
+    result = subprocess.run(command + ["--exit-after-first-frame"], env=env,
+                            capture_output=True, text=True, check=True)
+    times = json.loads(result.stdout.strip().splitlines()[-1])
+    times["process_ms"] = (time.perf_counter() - start) * 1000
+    return times
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecida"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de arranque do jogo (até ao primeiro frame)")
+    parser.add_argument("--runs", type=int, default=5, help="execuções (mediana e mínimo)")
+    parser.add_argument("--command", nargs="+", help="executável a medir (por omissão python src/main.py)")
+    parser.add_argument("--window", action="store_true", help="abre a janela real em vez do driver dummy")
+    parser.add_argument("--label", default="", help="nome da versão no histórico")
+    parser.add_argument("--history", default="startup_history.jsonl", help="histórico JSONL ('' = não gravar)")
+    args = parser.parse_args(argv)
+
+    command = args.command or [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")]
+    env = dict(os.environ)
+    if not args.window:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+    runs = [run_once(command, env) for _ in range(args.runs)]
+
+    record = {
+        "label": args.label,
+        "revision": git_revision(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs
+    }
+    for metric in METRICS:
+        values = [run[metric] for run in runs]
+        record[metric] = statistics.median(values)
+        record[metric.replace("_ms", "_min_ms")] = min(values)
+
+    previous = None
+    if args.history and os.path.exists(args.history):
+        with open(args.history, 'r') as f:
+            lines = [line for line in f if line.strip()]
+        if lines:
+            previous = json.loads(lines[-1])
+
+    print(f"{'métrica':<16}{'mediana':>10}{'mínimo':>10}{'anterior':>10}")
+    for metric in METRICS:
+        before = f"{previous[metric]:.0f}" if previous and metric in previous else "-"
+        print(f"{metric:<16}{record[metric]:>10.0f}{record[metric.replace('_ms', '_min_ms')]:>10.0f}{before:>10}")
+
+    if args.history:
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
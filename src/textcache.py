@@ -0,0 +1,75 @@
+# Este código foi feito por Azam Usman
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    # Cache LRU de superfícies de texto, indexada por (fonte, texto, cor, antialias)
+    def __init__(self, capacity=256):
+        self.capacity = capacity   # Máximo de superfícies guardadas
+        self.entries = OrderedDict()   # Mais recente no fim
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _store(self, key, surface):
+        self.entries[key] = surface
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)   # Remove a menos usada
+            self.evictions += 1
+        return surface
+
+    def _lookup(self, key):
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return surface
+
+    def render(self, font, text, color, antialias=True):
+        # Igual a font.render, mas só rasteriza texto novo
+        key = (font, text, tuple(color), antialias)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = self._store(key, font.render(text, antialias, color))
+        return surface
+
+    def render_number(self, font, prefix, number, color, suffix="", antialias=True):
+        # Texto "prefixo + número + sufixo"; quando o número muda, compõe a partir de
+        # glifos já em cache em vez de rasterizar a linha inteira de novo
+        text = f"{prefix}{number}{suffix}"
+        key = (font, text, tuple(color), antialias)
+        surface = self._lookup(key)
+        if surface is not None:
+            return surface
+        # Prefixo e sufixo inteiros (com kerning); dígitos um a um, pelo avanço inteiro de cada glifo
+        digits = str(number)
+        advances = [metrics[4] for metrics in font.metrics(digits)]
+        head = self.render(font, prefix, color, antialias)
+        tail = self.render(font, suffix, color, antialias)
+        x = font.size(prefix)[0] if prefix else 0
+        width = x + sum(advances) + tail.get_width()
+        surface = pygame.Surface((width, max(head.get_height(), tail.get_height(), font.get_height())), pygame.SRCALPHA)
+        # As peças não se sobrepõem: BLEND_RGBA_MAX copia-as sem escurecer o alfa
+        surface.blit(head, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        for digit, advance in zip(digits, advances):
+            surface.blit(self.render(font, digit, color, antialias), (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += advance
+        surface.blit(tail, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return self._store(key, surface)
+
+    def stats(self):
+        # Estatísticas de uso (para perfis e depuração)
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def clear(self):
+        self.entries.clear()
\ No newline at end of file
@@ -0,0 +1,220 @@
+# Este código foi feito por Azam Usman
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+import numpy as np
+from config import Config
+from simulation import Simulation, UP, DOWN, LEFT, RIGHT, OPPOSITE
+from replay import ReplayRecorder
+
+# Executor Monte Carlo: distribui jogos (semente, modo, dificuldade, política) por processos
+# e agrega distribuições de pontuação, comprimento e tempo de sobrevivência.
+# Exemplo: python src/tournament.py --games 2000 --modes survival --checkpoint runs/bombas
+
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+FIELDS = ["chunk", "seed", "mode", "difficulty", "policy", "score", "length", "ticks", "sim_time"]
+KEY_FIELDS = FIELDS[:5]   # Identificam um jogo (linhas repetidas de um lote reescrito ficam só uma vez)
+
+def random_policy(sim, rng):
+    # Vira aleatoriamente de vez em quando
+    if rng.random() < 0.2:
+        return rng.choice(DIRECTIONS)
+    return None
+
+def _is_safe(sim, direction):
+    # Verifica se a próxima célula nessa direção não mata a cobra
+    head_x = sim.snake[0][0] + direction[0] * sim.grid
+    head_y = sim.snake[0][1] + direction[1] * sim.grid
+    if sim.mode == "survival":
+        if head_x < 0 or head_x >= sim.width or head_y < 0 or head_y >= sim.height:
+            return False
+        if sim._cell(head_x, head_y) in sim.bomb_cells:
+            return False
+    else:
+        head_x %= sim.width
+        head_y %= sim.height
+    return not sim.occupied[sim._cell(head_x, head_y)]
+
+def greedy_policy(sim, rng):
+    # Aproxima-se da comida evitando colisões imediatas
+    head_x, head_y = sim.snake[0]
+    options = [d for d in DIRECTIONS if d != OPPOSITE[sim.direction] and _is_safe(sim, d)]
+    if not options:
+        return None
+    return min(options, key=lambda d: (abs(head_x + d[0] * sim.grid - sim.food[0]) +
+                                       abs(head_y + d[1] * sim.grid - sim.food[1]), rng.random()))
+
+POLICIES = {"random": random_policy, "greedy": greedy_policy}
+
+def make_config(difficulty, overrides):
+    # Config sem leitura do disco com os parâmetros de balanceamento pedidos
+    config = Config(load=False)
+    config.difficulty = difficulty
+    if overrides.get("base_speed") is not None:
+        config.base_speed = dict(config.base_speed, **{difficulty: overrides["base_speed"]})
+    if overrides.get("speed_increment") is not None:
+        config.speed_increment = overrides["speed_increment"]
+    return config
+
+def play(seed, mode, difficulty, policy, overrides, max_ticks, replay_dir=None):
+    # Joga um jogo headless completo e devolve (pontuação, comprimento, ticks, tempo simulado)
+    sim = Simulation(make_config(difficulty, overrides), mode, seed=seed)
+    for name in ("min_time", "max_time", "bomb_interval_start", "bomb_interval_min", "bomb_interval_foods"):
+        if overrides.get(name) is not None:
+            setattr(sim, name, overrides[name])
+    recorder = ReplayRecorder(sim) if replay_dir else None
+    choose = POLICIES[policy]
+    policy_rng = random.Random(seed ^ 0x5EED)
+    while not sim.game_over and sim.ticks < max_ticks:
+        if sim.waiting_for_respawn:
+            sim.trigger_respawn()
+        direction = choose(sim, policy_rng)
+        if direction is not None:
+            sim.set_direction(direction)
+        sim.step(1)
+    if recorder:
+        recorder.finish().save(os.path.join(replay_dir, f"{mode}-{difficulty}-{policy}-{seed}.snkr"))
+    return sim.score, len(sim.snake), sim.ticks, sim.clock.now
+
+def run_chunk(task):
+    # Executado nos processos: joga um lote de jogos e devolve as linhas compactas
+    chunk_id, jobs, overrides, max_ticks, replay_dir = task
+    rows = []
+    for seed, mode, difficulty, policy in jobs:
+        score, length, ticks, sim_time = play(seed, mode, difficulty, policy, overrides, max_ticks, replay_dir)
+        rows.append((chunk_id, seed, mode, difficulty, policy, score, length, ticks, round(sim_time, 3)))
+    return chunk_id, rows
+
+def build_chunks(args):
+    # Lista determinística de jogos dividida em lotes numerados
+    jobs = list(itertools.product(
+        range(args.seed, args.seed + args.games), args.modes, args.difficulties, args.policies))
+    return [jobs[i:i + args.chunk_size] for i in range(0, len(jobs), args.chunk_size)]
+
+def load_checkpoint(path, meta):
+    # Lê os resultados de lotes concluídos; lotes a meio são ignorados e repetidos.
+    # Um lote interrompido depois de escrever linhas pode aparecer duas vezes no CSV: fica a última cópia.
+    meta_path, done_path = path + ".meta.json", path + ".done"
+    if not os.path.exists(meta_path):
+        return set(), []
+    with open(meta_path, "r") as f:
+        if json.load(f) != meta:
+            raise SystemExit(f"Checkpoint {path} foi criado com outros parâmetros")
+    done = set()
+    if os.path.exists(done_path):
+        with open(done_path, "r") as f:
+            done = {int(line) for line in f if line.strip()}
+    rows = {}
+    if os.path.exists(path):
+        with open(path, "r", newline="") as f:
+            for row in csv.DictReader(f):
+                if None in row or None in row.values():
+                    continue   # Linha cortada a meio por uma interrupção
+                if int(row["chunk"]) in done:
+                    rows[tuple(row[name] for name in KEY_FIELDS)] = row
+    return done, list(rows.values())
+
+def rewrite_checkpoint(path, rows):
+    # Substitui o CSV (de forma atómica) só pelas linhas dos lotes concluídos, antes de retomar
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def summarize(rows):
+    # Agrega distribuições por (modo, dificuldade, política)
+    groups = {}
+    for row in rows:
+        key = (row["mode"], row["difficulty"], row["policy"])
+        groups.setdefault(key, []).append((float(row["score"]), float(row["length"]), float(row["sim_time"])))
+    print(f"{'modo':<12} {'dific.':<7} {'política':<8} {'jogos':>7}  "
+          f"{'pontuação p50/p90/máx':>22}  {'comprimento p50/p90':>20}  {'tempo(s) média/p90':>19}")
+    for key in sorted(groups):
+        data = np.array(groups[key])
+        score, length, sim_time = data[:, 0], data[:, 1], data[:, 2]
+        print(f"{key[0]:<12} {key[1]:<7} {key[2]:<8} {len(data):>7}  "
+              f"{np.percentile(score, 50):>7.0f}/{np.percentile(score, 90):>6.0f}/{score.max():>7.0f}  "
+              f"{np.percentile(length, 50):>10.0f}/{np.percentile(length, 90):>9.0f}  "
+              f"{sim_time.mean():>9.1f}/{np.percentile(sim_time, 90):>9.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo de jogos headless em vários processos")
+    parser.add_argument("--games", type=int, default=1000, help="sementes por combinação")
+    parser.add_argument("--seed", type=int, default=0, help="primeira semente")
+    parser.add_argument("--modes", nargs="+", default=["classic", "time_attack", "survival"])
+    parser.add_argument("--difficulties", nargs="+", default=["medium"])
+    parser.add_argument("--policies", nargs="+", default=["greedy"], choices=sorted(POLICIES))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=50, help="jogos por lote enviado a um processo")
+    parser.add_argument("--max-ticks", type=int, default=20000, help="limite de ticks por jogo")
+    parser.add_argument("--checkpoint", help="CSV de resultados; retoma a execução se já existir")
+    parser.add_argument("--replays", help="pasta onde gravar o replay binário de cada jogo")
+    parser.add_argument("--base-speed", type=float)
+    parser.add_argument("--speed-increment", type=float)
+    parser.add_argument("--min-time", type=float)
+    parser.add_argument("--max-time", type=float)
+    parser.add_argument("--bomb-interval-start", type=float)
+    parser.add_argument("--bomb-interval-min", type=float)
+    parser.add_argument("--bomb-interval-foods", type=float)
+    args = parser.parse_args(argv)
+
+    overrides = {name: getattr(args, name) for name in (
+        "base_speed", "speed_increment", "min_time", "max_time",
+        "bomb_interval_start", "bomb_interval_min", "bomb_interval_foods")}
+    chunks = build_chunks(args)
+    meta = {"games": args.games, "seed": args.seed, "modes": args.modes, "difficulties": args.difficulties,
+            "policies": args.policies, "chunk_size": args.chunk_size, "max_ticks": args.max_ticks,
+            "overrides": overrides}
+
+    done, rows = set(), []
+    writer = done_file = None
+    if args.checkpoint:
+        done, rows = load_checkpoint(args.checkpoint, meta)
+        with open(args.checkpoint + ".meta.json", "w") as f:
+            json.dump(meta, f)
+        rewrite_checkpoint(args.checkpoint, rows)
+        results_file = open(args.checkpoint, "a", newline="")
+        writer = csv.writer(results_file)
+        done_file = open(args.checkpoint + ".done", "a")
+
+    if args.replays:
+        os.makedirs(args.replays, exist_ok=True)
+    pending = [(i, jobs, overrides, args.max_ticks, args.replays) for i, jobs in enumerate(chunks) if i not in done]
+    total_games = sum(len(task[1]) for task in pending)
+    print(f"{len(done)} lotes retomados, {len(pending)} lotes ({total_games} jogos) por jogar", file=sys.stderr)
+
+    start = time.perf_counter()
+    played = 0
+    with Pool(args.workers) as pool:
+        for chunk_id, chunk_rows in pool.imap_unordered(run_chunk, pending):
+            rows.extend(dict(zip(FIELDS, row)) for row in chunk_rows)
+            played += len(chunk_rows)
+            if writer:
+                # Primeiro as linhas, depois a marca de lote concluído
+                writer.writerows(chunk_rows)
+                results_file.flush()
+                os.fsync(results_file.fileno())
+                done_file.write(f"{chunk_id}\n")
+                done_file.flush()
+                os.fsync(done_file.fileno())
+    elapsed = time.perf_counter() - start
+    if writer:
+        results_file.close()
+        done_file.close()
+
+    if played:
+        print(f"{played} jogos em {elapsed:.1f}s ({played / elapsed:.0f} jogos/s)", file=sys.stderr)
+    summarize(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
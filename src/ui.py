@@ -0,0 +1,136 @@
+# Este código foi feito por Azam Usman
+import pygame
+
+def merge_rects(rects):
+    # Funde os retângulos que se sobrepõem até não haver sobreposições
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index >= 0:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+class HitIndex:
+    # Retângulos clicáveis do último ecrã desenhado, partilhados entre o renderer e o input
+    def __init__(self):
+        self.entries = []   # (retângulo, valor)
+
+    def set(self, entries):
+        self.entries = list(entries)
+
+    def clear(self):
+        self.entries = []
+
+    def hit(self, pos):
+        # Valor do elemento sob pos (ou None)
+        for rect, value in self.entries:
+            if rect.collidepoint(pos):
+                return value
+        return None
+
+class Widget:
+    # Elemento de interface retido: guarda o que desenhou e só pede repintura quando muda.
+    # Cada subclasse define draw(surface).
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.dirty = True
+        self.painted = None   # Área ocupada na última pintura (None = ainda não pintado)
+
+class Panel(Widget):
+    # Retângulo de fundo (caixa do título, destaque do item selecionado)
+    def __init__(self, rect, color, border_radius=0):
+        super().__init__(rect)
+        self.color = color
+        self.border_radius = border_radius
+
+    def draw(self, surface):
+        pygame.draw.rect(surface, self.color, self.rect, border_radius=self.border_radius)
+
+class Label(Widget):
+    # Texto com a superfície em cache (TextCache); só volta a rasterizar quando o texto ou a cor mudam
+    def __init__(self, text_cache, font, text, color, **anchor):
+        super().__init__((0, 0, 0, 0))
+        self.text_cache = text_cache
+        self.font = font
+        self.anchor = anchor   # Ex.: center=(x, y) ou topleft=(x, y)
+        self.text = None
+        self.color = None
+        self.set(text, color)
+
+    def set(self, text, color):
+        # Atualiza o texto/cor; devolve True se mudou
+        if text == self.text and color == self.color:
+            return False
+        self.text, self.color = text, color
+        self.surface = self.text_cache.render(self.font, text, color)
+        self.rect = self.surface.get_rect(**self.anchor)
+        self.dirty = True
+        return True
+
+    def draw(self, surface):
+        surface.blit(self.surface, self.rect)
+
+class Button(Widget):
+    # Item de menu: área de clique fixa, destaque quando selecionado e rótulo centrado
+    def __init__(self, rect, label, highlight):
+        super().__init__(rect)
+        self.label = label
+        self.highlight = highlight   # Cor do destaque
+        self.selected = False
+
+    def set_selected(self, selected):
+        if selected != self.selected:
+            self.selected = selected
+            self.dirty = True
+
+    def set_text(self, text, color):
+        if self.label.set(text, color):
+            self.dirty = True
+
+    def draw(self, surface):
+        if self.selected:
+            pygame.draw.rect(surface, self.highlight, self.rect, border_radius=10)
+        self.label.draw(surface)
+
+class UILayer:
+    # Conjunto de widgets desenhados por ordem sobre uma cor de fundo; repinta só as áreas alteradas
+    def __init__(self, widgets, background):
+        self.widgets = widgets
+        self.background = background   # Cor de fundo do ecrã
+
+    def take_dirty(self):
+        # Áreas dos widgets que mudaram desde a última pintura (a posição antiga e a nova)
+        rects = []
+        for widget in self.widgets:
+            if widget.dirty:
+                rects.append(widget.rect if widget.painted is None else widget.rect.union(widget.painted))
+                widget.painted = widget.rect.copy()
+                widget.dirty = False
+        return rects
+
+    def paint(self, surface, rects, underlay=None):
+        # Repinta as áreas: fundo, underlay(surface) (ex.: partículas) e os widgets que as intersetam.
+        # Áreas sobrepostas são fundidas antes, para nenhum texto ser misturado duas vezes.
+        rects = merge_rects(rects)
+        for rect in rects:
+            surface.fill(self.background, rect)
+        if underlay is not None:
+            underlay(surface)
+        for rect in rects:
+            surface.set_clip(rect)
+            for widget in self.widgets:
+                if widget.rect.colliderect(rect):
+                    widget.draw(surface)
+        surface.set_clip(None)
+
+    def paint_all(self, surface, underlay=None):
+        surface.fill(self.background)
+        if underlay is not None:
+            underlay(surface)
+        for widget in self.widgets:
+            widget.draw(surface)
+            widget.painted = widget.rect.copy()
+            widget.dirty = False
\ No newline at end of file
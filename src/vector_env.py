@@ -0,0 +1,310 @@
+# Este código foi feito por Azam Usman
+import math
+import numpy as np
+from config import Config
+
+# Modos codificados como inteiros (um por tabuleiro)
+MODES = ("classic", "time_attack", "survival")
+CLASSIC, TIME_ATTACK, SURVIVAL = range(3)
+
+# Ações: 0 = cima, 1 = direita, 2 = baixo, 3 = esquerda (-1 = manter direção)
+DX = np.array([0, 1, 0, -1], dtype=np.int32)
+DY = np.array([-1, 0, 1, 0], dtype=np.int32)
+
+class VectorSnakeEnv:
+    # K tabuleiros guardados em arrays NumPy e avançados em conjunto com step(actions).
+    # Regras iguais a Simulation.update (um tick = 1/velocidade segundos simulados),
+    # exceto que no modo survival o renascimento é imediato (não espera por tecla).
+    def __init__(self, num_envs, mode="classic", config=None, seed=None):
+        self.config = config if config is not None else Config(load=False)
+        self.num_envs = num_envs
+        self.rng = np.random.default_rng(seed)
+        self.cols = self.config.screen_width // self.config.grid_size
+        self.rows = self.config.screen_height // self.config.grid_size
+        self.num_cells = self.cols * self.rows
+        self.diagonal = math.sqrt(self.config.screen_width**2 + self.config.screen_height**2)
+
+        # Parâmetros das regras (iguais aos de Simulation)
+        self.max_time = 60.0
+        self.min_time = 5.0
+        self.bomb_lifetime = 10
+        self.bomb_interval_start = 6
+        self.bomb_interval_min = 2
+        self.bomb_interval_foods = 10
+        self.bomb_slots = 0   # Bombas vivas ao mesmo tempo (calculado em reset a partir dos parâmetros)
+
+        k, n = num_envs, self.num_cells
+        cell_type = np.int16 if n <= np.iinfo(np.int16).max else np.int32
+        if isinstance(mode, str):
+            self.mode = np.full(k, MODES.index(mode), dtype=np.int8)
+        else:
+            self.mode = np.array([MODES.index(m) for m in mode], dtype=np.int8)   # Um modo por tabuleiro
+
+        # Cobra: anel circular de células (cabeça em body[k, head_ptr[k]]) + grelha de ocupação
+        self.body = np.zeros((k, n), dtype=cell_type)
+        self.head_ptr = np.zeros(k, dtype=np.int32)
+        self.length = np.zeros(k, dtype=np.int32)
+        self.occ = np.zeros((k, n), dtype=np.bool_)
+        self.direction = np.zeros(k, dtype=np.int8)
+        self.food = np.zeros(k, dtype=np.int32)
+        # Bombas: slots por tabuleiro (célula -1 = vazio)
+        self.bomb_cell = np.full((k, 0), -1, dtype=np.int32)
+        self.bomb_birth = np.zeros((k, 0), dtype=np.float64)
+
+        self.score = np.zeros(k, dtype=np.int32)
+        self.foods_eaten = np.zeros(k, dtype=np.int32)
+        self.speed = np.zeros(k, dtype=np.float64)
+        self.clock = np.zeros(k, dtype=np.float64)   # Tempo simulado por tabuleiro
+        self.ticks = np.zeros(k, dtype=np.int64)
+        self.time_remaining = np.zeros(k, dtype=np.float64)
+        self.time_set = np.zeros(k, dtype=np.bool_)
+        self.lives = np.zeros(k, dtype=np.int32)
+        self.bomb_spawn_timer = np.zeros(k, dtype=np.float64)
+        self.done = np.zeros(k, dtype=np.bool_)
+
+        self._window = self._build_window(3)   # Vizinhança 7x7 para bombas perto da comida
+        cx = (self.config.screen_width // 2) // self.config.grid_size
+        cy = (self.config.screen_height // 2) // self.config.grid_size
+        self._initial_cells = np.array([cy * self.cols + cx - i for i in range(3)], dtype=cell_type)
+        self.reset()
+
+    def _build_window(self, radius):
+        # Tabela célula -> células da janela (2*radius+1)^2 à volta (-1 fora do tabuleiro)
+        cells = np.arange(self.num_cells)
+        x, y = cells % self.cols, cells // self.cols
+        offsets = np.arange(-radius, radius + 1)
+        wx = x[:, None, None] + offsets[None, None, :]
+        wy = y[:, None, None] + offsets[None, :, None]
+        inside = (wx >= 0) & (wx < self.cols) & (wy >= 0) & (wy < self.rows)
+        window = np.where(inside, wy * self.cols + wx, -1)
+        return window.reshape(self.num_cells, -1).astype(np.int32)
+
+    def reset(self, indices=None):
+        # Reinicia os tabuleiros indicados (todos por omissão)
+        idx = np.arange(self.num_envs) if indices is None else np.asarray(indices, dtype=np.int64)
+        if idx.size == 0:
+            return
+        self._fit_bomb_slots()
+        base_speed = self.config.base_speed[self.config.difficulty]
+        self.score[idx] = 0
+        self.foods_eaten[idx] = 0
+        self.speed[idx] = base_speed
+        self.clock[idx] = 0.0
+        self.ticks[idx] = 0
+        self.time_remaining[idx] = 20.0
+        self.time_set[idx] = False
+        self.lives[idx] = 3
+        self.bomb_spawn_timer[idx] = 0.0
+        self.bomb_cell[idx] = -1
+        self.done[idx] = False
+        self._place_snakes(idx)
+        self.food[idx] = -1
+        self._respawn_food(idx)
+
+    def _fit_bomb_slots(self):
+        # Bombas vivas ao mesmo tempo: no máximo uma a cada bomb_interval_min segundos durante
+        # bomb_lifetime. Só cresce (as bombas dos tabuleiros que não reiniciam são mantidas).
+        slots = int(math.ceil(self.bomb_lifetime / self.bomb_interval_min)) + 1
+        if slots > self.bomb_slots:
+            extra = slots - self.bomb_slots
+            self.bomb_cell = np.pad(self.bomb_cell, ((0, 0), (0, extra)), constant_values=-1)
+            self.bomb_birth = np.pad(self.bomb_birth, ((0, 0), (0, extra)))
+            self.bomb_slots = slots
+
+    def _place_snakes(self, idx):
+        # Cobra inicial de três segmentos no centro, virada para a direita
+        self.occ[idx] = False
+        self.body[idx, :3] = self._initial_cells
+        self.head_ptr[idx] = 0
+        self.length[idx] = 3
+        self.direction[idx] = 1
+        self.occ[idx[:, None], self._initial_cells[None, :]] = True
+
+    def _blocked(self, idx):
+        # Células não livres (cobra, comida e bombas) de cada tabuleiro em idx
+        blocked = self.occ[idx].copy()
+        rows = np.arange(idx.size)
+        food = self.food[idx]
+        has_food = food >= 0
+        blocked[rows[has_food], food[has_food]] = True
+        bombs = self.bomb_cell[idx]
+        r, s = np.nonzero(bombs >= 0)
+        blocked[r, bombs[r, s]] = True
+        return blocked
+
+    def _sample_free(self, blocked):
+        # Célula livre uniforme por linha (chaves aleatórias + argmax); -1 se não houver
+        keys = self.rng.random(blocked.shape, dtype=np.float32)
+        keys[blocked] = -1.0
+        cells = keys.argmax(axis=1)
+        cells[keys[np.arange(cells.size), cells] < 0] = -1
+        return cells
+
+    def _respawn_food(self, idx):
+        # Nova comida numa célula livre; tabuleiro cheio termina o jogo
+        if idx.size == 0:
+            return
+        self.food[idx] = -1
+        cells = self._sample_free(self._blocked(idx))
+        self.food[idx] = cells
+        self.done[idx[cells < 0]] = True
+
+    def _spawn_bombs(self, idx):
+        # Uma bomba por tabuleiro em idx: 70% perto da comida, 30% aleatória.
+        # Tabuleiros sem slot livre não recebem bomba (nunca substitui uma bomba viva).
+        idx = idx[(self.bomb_cell[idx] < 0).any(axis=1)]
+        if idx.size == 0:
+            return
+        blocked = self._blocked(idx)
+        rows = np.arange(idx.size)
+        cells = np.full(idx.size, -1, dtype=np.int64)
+
+        near = self.rng.random(idx.size) < 0.7
+        if near.any():
+            nr = rows[near]
+            candidates = self._window[self.food[idx[nr]]]
+            ok = (candidates >= 0) & ~blocked[nr[:, None], np.maximum(candidates, 0)]
+            keys = self.rng.random(candidates.shape, dtype=np.float32)
+            keys[~ok] = -1.0
+            pick = keys.argmax(axis=1)
+            found = ok[np.arange(nr.size), pick]
+            cells[nr[found]] = candidates[np.arange(nr.size), pick][found]
+
+        missing = rows[cells < 0]
+        if missing.size:
+            cells[missing] = self._sample_free(blocked[missing])
+
+        placed = cells >= 0
+        idx, cells = idx[placed], cells[placed]
+        slot = (self.bomb_cell[idx] < 0).argmax(axis=1)
+        self.bomb_cell[idx, slot] = cells
+        self.bomb_birth[idx, slot] = self.clock[idx]
+
+    def _collide(self, idx):
+        # Colisões: fim de jogo, ou perde uma vida e renasce no modo survival
+        survival = self.mode[idx] == SURVIVAL
+        self.done[idx[~survival]] = True
+        idx = idx[survival]
+        self.lives[idx] -= 1
+        self.done[idx[self.lives[idx] <= 0]] = True
+        idx = idx[self.lives[idx] > 0]
+        if idx.size == 0:
+            return
+        self._place_snakes(idx)
+        # Bombas debaixo da nova cobra desaparecem e a comida muda de sítio
+        bombs = self.bomb_cell[idx]
+        under = (bombs >= 0) & self.occ[idx[:, None], np.maximum(bombs, 0)]
+        bombs[under] = -1
+        self.bomb_cell[idx] = bombs
+        self._respawn_food(idx[self.occ[idx, self.food[idx]]])
+
+    def step(self, actions=None):
+        # Avança todos os tabuleiros ativos um tick; devolve (recompensas, terminados)
+        reward = np.zeros(self.num_envs, dtype=np.float32)
+        active = ~self.done
+
+        if actions is not None:
+            actions = np.asarray(actions)
+            turn = active & (actions >= 0) & ((actions - self.direction) % 4 != 2)
+            self.direction[turn] = actions[turn]
+
+        dt = 1.0 / self.speed
+        self.clock[active] += dt[active]
+        self.ticks[active] += 1
+
+        # Modo Time Attack: tempo por comida baseado na distância e no tamanho
+        ta = active & (self.mode == TIME_ATTACK)
+        if ta.any():
+            fresh = np.flatnonzero(ta & ~self.time_set)
+            if fresh.size:
+                head = self.body[fresh, self.head_ptr[fresh]].astype(np.int64)
+                food = self.food[fresh]
+                dx = (food % self.cols - head % self.cols) * self.config.grid_size
+                dy = (food // self.cols - head // self.cols) * self.config.grid_size
+                normalized = np.sqrt(dx * dx + dy * dy) / self.diagonal
+                remaining = self.min_time + (self.max_time - self.min_time) * (1 - normalized**2)
+                remaining *= np.maximum(0.5, 1.0 - self.length[fresh] / 50)
+                self.time_remaining[fresh] = remaining
+                self.time_set[fresh] = True
+            self.time_remaining[ta] -= dt[ta]
+            timeout = ta & (self.time_remaining <= 0)
+            self.done |= timeout
+            active &= ~timeout
+
+        # Modo Survival: expira e gera bombas
+        sv = active & (self.mode == SURVIVAL)
+        if sv.any():
+            expired = (sv[:, None] & (self.bomb_cell >= 0) &
+                       (self.clock[:, None] - self.bomb_birth >= self.bomb_lifetime))
+            self.bomb_cell[expired] = -1
+            self.bomb_spawn_timer[sv] += dt[sv]
+            spawn = sv & (self.bomb_spawn_timer > np.maximum(
+                self.bomb_interval_min, self.bomb_interval_start - self.foods_eaten / self.bomb_interval_foods))
+            if spawn.any():
+                self._spawn_bombs(np.flatnonzero(spawn))
+                self.bomb_spawn_timer[spawn] = 0
+
+        # Move as cobras
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            return reward, self.done.copy()
+        head = self.body[idx, self.head_ptr[idx]].astype(np.int64)
+        d = self.direction[idx]
+        x = head % self.cols + DX[d]
+        y = head // self.cols + DY[d]
+        survival = self.mode[idx] == SURVIVAL
+        wall = survival & ((x < 0) | (x >= self.cols) | (y < 0) | (y >= self.rows))
+        new = (y % self.rows) * self.cols + x % self.cols   # Teletransporte nos outros modos
+
+        bomb_hit = survival[:, None] & (self.bomb_cell[idx] == new[:, None])
+        hit = wall | self.occ[idx, new] | (~wall & bomb_hit.any(axis=1))
+        if hit.any():
+            hit_idx = idx[hit]
+            self._collide(hit_idx)
+            # Remove a bomba atingida
+            r, s = np.nonzero(bomb_hit[hit] & ~wall[hit, None])
+            self.bomb_cell[hit_idx[r], s] = -1
+
+        idx, new = idx[~hit], new[~hit]
+        ptr = (self.head_ptr[idx] - 1) % self.num_cells
+        self.head_ptr[idx] = ptr
+        self.body[idx, ptr] = new
+        self.occ[idx, new] = True
+
+        ate = new == self.food[idx]
+        # Remove a cauda se não comeu
+        keep = idx[~ate]
+        tail = self.body[keep, (self.head_ptr[keep] + self.length[keep]) % self.num_cells]
+        self.occ[keep, tail] = False
+
+        grow = idx[ate]
+        if grow.size:
+            self.length[grow] += 1
+            self.score[grow] += 10
+            reward[grow] = 10.0
+            self.foods_eaten[grow] += 1
+            # Dificuldade progressiva - aumenta a velocidade
+            self.speed[grow] = np.minimum(
+                self.config.base_speed[self.config.difficulty] + self.foods_eaten[grow] * self.config.speed_increment,
+                self.config.max_speed
+            )
+            self.time_set[grow] = False
+            self._respawn_food(grow)
+
+        return reward, self.done.copy()
+
+    def snake_cells(self, i):
+        # Células da cobra do tabuleiro i, cabeça primeiro
+        ptrs = (self.head_ptr[i] + np.arange(self.length[i])) % self.num_cells
+        return self.body[i, ptrs]
+
+    def observation(self):
+        # Grelhas (K, linhas, colunas): 0 vazio, 1 corpo, 2 cabeça, 3 comida, 4 bomba
+        obs = self.occ.astype(np.int8)
+        rows = np.arange(self.num_envs)
+        r, s = np.nonzero(self.bomb_cell >= 0)
+        obs[r, self.bomb_cell[r, s]] = 4
+        has_food = self.food >= 0
+        obs[rows[has_food], self.food[has_food]] = 3
+        obs[rows, self.body[rows, self.head_ptr]] = 2
+        return obs.reshape(self.num_envs, self.rows, self.cols)
\ No newline at end of file
@@ -0,0 +1,8 @@
+# Este código foi feito por Azam Usman
+import os
+import sys
+
+# Testes sem ecrã nem áudio; os módulos do jogo são importados diretamente de src/
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
\ No newline at end of file
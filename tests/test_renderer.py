@@ -0,0 +1,32 @@
+# Este código foi feito por Azam Usman
+import random
+import pygame
+from config import Config
+from renderer import Renderer
+from simulation import Simulation
+from tournament import greedy_policy
+
+def test_dirty_and_full_frames_match_between_ticks(monkeypatch):
+    # O modo incremental (dirty rects) e o redesenho completo mostram o mesmo frame a qualquer alpha
+    pygame.display.init()
+    pygame.font.init()
+    config = Config(load=False)
+    monkeypatch.setattr(Config, "_shared", config)
+    size = (config.screen_width, config.screen_height)
+    dirty_screen, full_screen = pygame.Surface(size), pygame.Surface(size)
+    dirty, full = Renderer(dirty_screen), Renderer(full_screen)
+    sim = Simulation(config, "survival", seed=5)
+    policy_rng = random.Random(1)
+    while not sim.game_over and sim.ticks < 60:
+        if sim.waiting_for_respawn:
+            sim.trigger_respawn()
+        direction = greedy_policy(sim, policy_rng)
+        if direction is not None:
+            sim.set_direction(direction)
+        sim.step(1)
+        for alpha in (0.0, 0.5, None):
+            config.dirty_rects = True
+            dirty.draw_game(sim.view, alpha)
+            config.dirty_rects = False
+            full.draw_game(sim.view, alpha)
+            assert pygame.image.tobytes(dirty_screen, "RGB") == pygame.image.tobytes(full_screen, "RGB"), (sim.ticks, alpha)
\ No newline at end of file
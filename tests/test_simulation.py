@@ -0,0 +1,20 @@
+# Este código foi feito por Azam Usman
+import pytest
+from config import Config
+from simulation import Simulation
+
+@pytest.mark.parametrize("change", [
+    {"world_cols": 40, "world_rows": 60},   # 60x40 -> 40x60
+    {"screen_width": 600, "screen_height": 400, "grid_size": 10}   # 60x40 células de 20 px -> de 10 px
+])
+def test_reset_after_shape_change_with_same_cell_count(change):
+    # As grades só são reutilizadas se colunas, linhas e grade forem as mesmas
+    config = Config(load=False)
+    sim = Simulation(config, "survival", seed=1)
+    sim.step(5)
+    for name, value in change.items():
+        setattr(config, name, value)
+    sim.reset("survival", seed=2)
+    assert sum(sim.occupied) == len(sim.snake)
+    assert all(sim.occupied[sim._cell(x, y)] for x, y in sim.snake)
+    assert len(sim.free) == sim.cols * sim.rows - len(sim.snake) - 1   # Sem a cobra e a comida
\ No newline at end of file